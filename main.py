@@ -1,21 +1,374 @@
-from fastapi import FastAPI, File, UploadFile, Form
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 from enum import Enum
 import random
 import re
 import json
+import base64
 from datetime import datetime
+from collections import OrderedDict
 import urllib.request
 import urllib.parse
+import urllib.error
 import ssl
+import os
+import time
+import zlib
+import hashlib
+import threading
+import math
+import gzip
+import typing
+import sqlite3
+import ipaddress
+import queue
+import sys
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache, wraps
+import contextvars
 
 
-PDF_SUPPORT = False
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+CACHE_DIR = os.environ.get("CITEGUARD_CACHE_DIR", ".citeguard_cache")
+CACHE_MAX_BYTES = int(os.environ.get("CITEGUARD_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+CACHE_TOUCH_SECONDS = 30
+CACHE_TOUCH_BATCH = 256
+CACHE_EVICT_TARGET = 0.9
+URL_FRESH_SECONDS = int(os.environ.get("CITEGUARD_URL_FRESH_SECONDS", 300))
+MULTI_MAX_PARALLEL = int(os.environ.get("CITEGUARD_MULTI_MAX_PARALLEL", 8))
+MULTI_MAX_SOURCES = 50
+MULTI_MAX_CITATIONS = 10
+API_CACHE_SECONDS = int(os.environ.get("CITEGUARD_API_CACHE_SECONDS", 24 * 3600))
+AUDIT_MAX_PARALLEL = int(os.environ.get("CITEGUARD_AUDIT_MAX_PARALLEL", 4))
+ABSTRACT_BATCH_SIZE = 200
+ABSTRACT_CITATIONS_PER_PAPER = 2
+PROVIDERS = ('pubmed', 'semantic_scholar', 'wikipedia')
+PROVIDER_PAGE_SIZE = 10
+PAGE_MAX_PARALLEL = int(os.environ.get("CITEGUARD_PAGE_MAX_PARALLEL", 6))
+DEFAULT_MAX_RESULTS = 2
+MAX_RESULTS_LIMIT = 100
+MAX_CURSOR_OFFSET = 1000
+DATA_DIR = os.environ.get("CITEGUARD_DATA_DIR", ".citeguard_data")
+JOB_WORKERS = int(os.environ.get("CITEGUARD_JOB_WORKERS", 2))
+JOB_POLL_SECONDS = 0.5
+JOB_STALE_SECONDS = int(os.environ.get("CITEGUARD_JOB_STALE_SECONDS", 300))
+JOB_RETENTION_SECONDS = 7 * 24 * 3600
+CLAIM_RETRY_SECONDS = 3600
+DRAIN_SECONDS = int(os.environ.get("CITEGUARD_DRAIN_SECONDS", 20))
+NLI_MODEL = os.environ.get("CITEGUARD_NLI_MODEL", "")
+NLI_BATCH_SIZE = int(os.environ.get("CITEGUARD_NLI_BATCH_SIZE", 16))
+STANCE_CACHE_SIZE = 20000
+TRACE_FILE = os.environ.get("CITEGUARD_TRACE_FILE", os.path.join(DATA_DIR, "traces.jsonl"))
+TRACE_ENDPOINT = os.environ.get("CITEGUARD_TRACE_ENDPOINT", "")
+TRACE_SAMPLE_RATE = float(os.environ.get("CITEGUARD_TRACE_SAMPLE_RATE", 0))
+TRACE_QUEUE_SIZE = 1000
+ADMIN_TOKEN = os.environ.get("CITEGUARD_ADMIN_TOKEN", "")
+PROFILE_INTERVAL = 0.005
+ROUTE_LIMITS = {'/verify': 16, '/verify/url': 8, '/verify/pdf': 4, '/verify/multi': 4, '/audit': 4, '/jobs': 32, '/jobs/*/events': 64, '/claims': 8}
+ROUTE_LIMITS.update({
+    path.strip(): int(limit) for path, _, limit in
+    (item.partition('=') for item in os.environ.get("CITEGUARD_ROUTE_LIMITS", "").split(',') if '=' in item)
+})
+DEFAULT_ROUTE_LIMIT = int(os.environ.get("CITEGUARD_DEFAULT_ROUTE_LIMIT", 32))
+ADMISSION_QUEUE_DEPTH = int(os.environ.get("CITEGUARD_QUEUE_DEPTH", 16))
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get("CITEGUARD_QUEUE_TIMEOUT", 2.0))
+CLIENT_RATE = float(os.environ.get("CITEGUARD_CLIENT_RATE", 5))
+CLIENT_BURST = int(os.environ.get("CITEGUARD_CLIENT_BURST", 20))
+CLIENT_API_KEYS = {key.strip() for key in os.environ.get("CITEGUARD_API_KEYS", "").split(',') if key.strip()}
+TRUSTED_PROXIES = [ipaddress.ip_network(net.strip(), strict=False) for net in
+                   os.environ.get("CITEGUARD_TRUSTED_PROXIES", "127.0.0.1,::1").split(',') if net.strip()]
+ADMISSION_MAX_CLIENTS = 10000
+PRIORITY_PATHS = {'/health', '/ready'}
+COMPRESS_MIN_BYTES = int(os.environ.get("CITEGUARD_COMPRESS_MIN_BYTES", 1024))
 
-app = FastAPI(title="CiteGuard", version="3.0.0")
+readiness = {'ready': False, 'components': {}}
+
+def warm_up():
+    steps = [
+        ("cache", content_cache.warm, True),
+        ("jobs", jobs.warm, True),
+        ("claims", claims.warm, True),
+        ("engine", get_engine, True),
+        ("html", index_html, True),
+        ("pdf", PDFProcessor.library, False),
+        ("nli", StanceClassifier._load_model, False)
+    ]
+    ok = True
+    for name, step, required in steps:
+        start = time.perf_counter()
+        try:
+            result = step()
+            readiness['components'][name] = {'ok': True, 'ms': round((time.perf_counter() - start) * 1000, 1)}
+            if not required:
+                readiness['components'][name]['available'] = bool(result)
+        except Exception as e:
+            print(f"Warm-up {name} error: {e}")
+            readiness['components'][name] = {'ok': False, 'error': str(e)}
+            ok = ok and not required
+    readiness['ready'] = ok
+
+def drain(workers: List[threading.Thread], timeout: float):
+    deadline = time.monotonic() + timeout
+    for t in workers:
+        t.join(max(0.0, deadline - time.monotonic()))
+    if not upstream.wait_idle(max(0.0, deadline - time.monotonic())):
+        print("⚠ Shutdown timed out with upstream calls still in flight")
+
+@asynccontextmanager
+async def lifespan(app):
+    stop = threading.Event()
+    workers = jobs.start_workers(JOB_WORKERS, stop)
+    threading.Thread(target=warm_up, name="citeguard-warmup", daemon=True).start()
+    yield
+    stop.set()
+    await run_in_threadpool(drain, workers, DRAIN_SECONDS)
+
+class AdmissionMiddleware:
+    def __init__(self, app, route_limits: Dict[str, int], default_limit: int, queue_depth: int,
+                 queue_timeout: float, client_rate: float, client_burst: int, api_keys: set,
+                 trusted_proxies: List):
+        self.app = app
+        self.route_limits = route_limits
+        self.default_limit = default_limit
+        self.queue_depth = queue_depth
+        self.queue_timeout = queue_timeout
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.api_keys = api_keys
+        self.trusted_proxies = trusted_proxies
+        self._gates = {}
+        self._buckets = OrderedDict()
+    
+    @staticmethod
+    def _matches(prefix: str, path: str) -> bool:
+        want = prefix.rstrip('/').split('/')
+        have = path.rstrip('/').split('/')
+        return len(have) >= len(want) and all(w in ('*', h) for w, h in zip(want, have))
+    
+    def _route(self, path: str) -> str:
+        matches = [prefix for prefix in self.route_limits if self._matches(prefix, path)]
+        return max(matches, key=len) if matches else '*'
+    
+    def _gate(self, route: str) -> Dict:
+        if route not in self._gates:
+            limit = self.route_limits.get(route, self.default_limit)
+            self._gates[route] = {'sem': asyncio.Semaphore(limit), 'waiting': 0}
+        return self._gates[route]
+    
+    def _trusted(self, host: str) -> bool:
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_proxies)
+    
+    def _client(self, scope) -> str:
+        forwarded = []
+        for name, value in scope.get('headers', []):
+            if name == b'x-api-key' and value.decode('latin-1') in self.api_keys:
+                return "key:" + hashlib.sha256(value).hexdigest()[:16]
+            if name == b'x-forwarded-for':
+                forwarded.extend(hop.strip() for hop in value.decode('latin-1').split(',') if hop.strip())
+        client = scope.get('client')
+        hops = forwarded + [client[0] if client else "unknown"]
+        for host in reversed(hops):
+            if not self._trusted(host):
+                return "ip:" + host
+        return "ip:" + hops[0]
+    
+    def _take_token(self, client: str) -> float:
+        if self.client_rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(client, (self.client_burst, now))
+        tokens = min(self.client_burst, tokens + (now - updated) * self.client_rate)
+        retry = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry = (1 - tokens) / self.client_rate
+        self._buckets[client] = (tokens, now)
+        while len(self._buckets) > ADMISSION_MAX_CLIENTS:
+            self._buckets.popitem(last=False)
+        return retry
+    
+    async def _reject(self, send, status: int, detail: str, retry_after: float):
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+                (b'retry-after', str(max(1, math.ceil(retry_after))).encode())
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] == 'OPTIONS' or scope['path'] in PRIORITY_PATHS:
+            return await self.app(scope, receive, send)
+        
+        retry = self._take_token(self._client(scope))
+        if retry:
+            return await self._reject(send, 429, "Rate limit exceeded", retry)
+        
+        gate = self._gate(self._route(scope['path']))
+        if gate['sem'].locked() and gate['waiting'] >= self.queue_depth:
+            return await self._reject(send, 503, "Server busy, try again shortly", self.queue_timeout)
+        gate['waiting'] += 1
+        try:
+            await asyncio.wait_for(gate['sem'].acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            return await self._reject(send, 503, "Server busy, try again shortly", self.queue_timeout)
+        finally:
+            gate['waiting'] -= 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate['sem'].release()
+
+class TracingMiddleware:
+    def __init__(self, app, sample_rate: float, admin_token: str, profile_interval: float):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token
+        self.profile_interval = profile_interval
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+        query = urllib.parse.parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        headers = Headers(scope=scope)
+        profile = query.get('profile', [''])[-1] == '1'
+        if profile and (not self.admin_token or headers.get('x-admin-token') != self.admin_token):
+            response = JSONResponse({"detail": "Profiling requires a valid X-Admin-Token"}, status_code=403)
+            return await response(scope, receive, send)
+        traced = (profile or query.get('trace', [''])[-1] == '1'
+                  or headers.get('x-citeguard-trace') == '1'
+                  or (self.sample_rate and random.random() < self.sample_rate))
+        if not traced:
+            return await self.app(scope, receive, send)
+        
+        trace = Trace()
+        token = _trace_var.set(trace)
+        profiler = SamplingProfiler(trace, self.profile_interval).start() if profile else None
+        try:
+            with Tracer.span(f"{scope['method']} {scope['path']}",
+                             **{'http.method': scope['method'], 'http.target': scope['path']}) as attrs:
+                async def traced_send(message):
+                    if message['type'] == 'http.response.start':
+                        attrs['http.status_code'] = message['status']
+                        MutableHeaders(scope=message)['X-Trace-Id'] = trace.trace_id
+                    if not profiler:
+                        await send(message)
+                
+                await self.app(scope, receive, traced_send)
+        finally:
+            _trace_var.reset(token)
+            if profiler:
+                profiler.stop()
+            Tracer.export(trace)
+        
+        if profiler:
+            response = PlainTextResponse(profiler.collapsed(), headers={"X-Trace-Id": trace.trace_id})
+            await response(scope, receive, send)
+
+class CompressionMiddleware:
+    _brotli = None
+    
+    def __init__(self, app, minimum_size: int):
+        self.app = app
+        self.minimum_size = minimum_size
+    
+    @staticmethod
+    def brotli():
+        if CompressionMiddleware._brotli is None:
+            try:
+                import brotli
+                CompressionMiddleware._brotli = brotli
+            except ImportError:
+                CompressionMiddleware._brotli = False
+        return CompressionMiddleware._brotli or None
+    
+    def _encoding(self, scope) -> Optional[str]:
+        accepted = set()
+        for name, value in scope.get('headers', []):
+            if name == b'accept-encoding':
+                for item in value.decode('latin-1').split(','):
+                    coding, _, params = item.strip().partition(';')
+                    if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                        accepted.add(coding.strip().lower())
+        if 'br' in accepted and self.brotli():
+            return 'br'
+        if 'gzip' in accepted:
+            return 'gzip'
+        return None
+    
+    async def __call__(self, scope, receive, send):
+        encoding = self._encoding(scope) if scope['type'] == 'http' else None
+        if not encoding:
+            return await self.app(scope, receive, send)
+        
+        start = None
+        chunks = []
+        passthrough = False
+        
+        async def compressing_send(message):
+            nonlocal start, passthrough
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(raw=message['headers'])
+                if 'content-encoding' in headers or headers.get('content-type', '').startswith('text/event-stream'):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+            if message['type'] != 'http.response.body' or passthrough:
+                await send(message)
+                return
+            chunks.append(message.get('body', b''))
+            if message.get('more_body', False):
+                return
+            body = b''.join(chunks)
+            headers = MutableHeaders(raw=start['headers'])
+            if len(body) >= self.minimum_size:
+                body = self.brotli().compress(body, quality=5) if encoding == 'br' else gzip.compress(body, 6)
+                headers['Content-Encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+            headers['Content-Length'] = str(len(body))
+            await send(start)
+            await send({'type': 'http.response.body', 'body': body})
+        
+        await self.app(scope, receive, compressing_send)
+
+app = FastAPI(title="CiteGuard", version="3.0.0", lifespan=lifespan)
+app.add_middleware(
+    AdmissionMiddleware,
+    route_limits=ROUTE_LIMITS,
+    default_limit=DEFAULT_ROUTE_LIMIT,
+    queue_depth=ADMISSION_QUEUE_DEPTH,
+    queue_timeout=ADMISSION_QUEUE_TIMEOUT,
+    client_rate=CLIENT_RATE,
+    client_burst=CLIENT_BURST,
+    api_keys=CLIENT_API_KEYS,
+    trusted_proxies=TRUSTED_PROXIES
+)
+
+app.add_middleware(
+    TracingMiddleware,
+    sample_rate=TRACE_SAMPLE_RATE,
+    admin_token=ADMIN_TOKEN,
+    profile_interval=PROFILE_INTERVAL
+)
+
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESS_MIN_BYTES)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 class SourceType(str, Enum):
@@ -61,10 +414,74 @@ class VerifiedResult(BaseModel):
     explanation: str
     total_sources_checked: int
     verification_method: str
+    next_cursor: Optional[str] = None
+
+class SourceTiming(BaseModel):
+    source: str
+    kind: str
+    success: bool
+    elapsed_ms: float
+    citations_found: int
+    error: Optional[str] = None
+
+class MultiVerifiedResult(VerifiedResult):
+    source_timings: List[SourceTiming]
+
+class ClaimReport(BaseModel):
+    claim: str
+    sentence_index: int
+    page: Optional[int] = None
+    checkworthiness: float
+    result: VerifiedResult
+
+class AuditReport(BaseModel):
+    source_name: str
+    sentences_scanned: int
+    claims_detected: int
+    unique_lookups: int
+    summary: Dict[str, int]
+    claims: List[ClaimReport]
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class JobStatus(BaseModel):
+    job_id: str
+    kind: str
+    state: JobState
+    completed: int
+    total: int
+    progress: float
+    created_at: str
+    error: Optional[str] = None
+    result: Optional[Dict] = None
+
+class StoredClaim(BaseModel):
+    claim_id: str
+    claim: str
+    domain: str
+    url: Optional[str] = None
+    verified_at: str
+    refreshed_at: str
+    result: VerifiedResult
+
+class RefreshReport(BaseModel):
+    claims_due: int
+    dependencies_checked: int
+    providers_requeried: int
+    unchanged: int
+    recomputed: int
+    errors: int
+    status_changes: List[Dict[str, str]]
 
 class VerifyRequest(BaseModel):
     claim: str = Field(..., min_length=5, max_length=1000)
     domain: Optional[str] = "general"
+    max_results: Dict[str, int] = Field(default_factory=dict)
+    cursor: Optional[str] = None
 
 class URLRequest(BaseModel):
     url: str
@@ -75,49 +492,572 @@ class PasteRequest(BaseModel):
     claim: str
     source_name: Optional[str] = "Pasted Text"
 
+class StoreClaimRequest(BaseModel):
+    claim: str = Field(..., min_length=5, max_length=1000)
+    domain: str = "general"
+    url: Optional[str] = None
+
+class AuditRequest(BaseModel):
+    text: str = Field(..., min_length=50)
+    source_name: Optional[str] = "Pasted Text"
+    domain: Optional[str] = "general"
+    max_claims: int = Field(50, ge=1, le=200)
+
+_trace_var = contextvars.ContextVar("citeguard_trace", default=None)
+_span_var = contextvars.ContextVar("citeguard_span", default=None)
+
+class Trace:
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans = []
+        self.threads = {}
+        self._lock = threading.Lock()
+
+    def enter_thread(self):
+        tid = threading.get_ident()
+        with self._lock:
+            self.threads[tid] = self.threads.get(tid, 0) + 1
+
+    def exit_thread(self):
+        tid = threading.get_ident()
+        with self._lock:
+            self.threads[tid] -= 1
+            if not self.threads[tid]:
+                del self.threads[tid]
+
+    def add(self, record: Dict):
+        with self._lock:
+            self.spans.append(record)
+
+class Tracer:
+    _file_lock = threading.Lock()
+    _queue = queue.Queue(maxsize=TRACE_QUEUE_SIZE)
+    _exporter = None
+    _exporter_lock = threading.Lock()
+
+    @staticmethod
+    @contextmanager
+    def span(name: str, **attributes):
+        trace = _trace_var.get()
+        if trace is None:
+            yield None
+            return
+        parent = _span_var.get()
+        record = {
+            'spanId': os.urandom(8).hex(),
+            'parentSpanId': parent['spanId'] if parent else '',
+            'name': name,
+            'startTimeUnixNano': time.time_ns(),
+            'attributes': attributes,
+            'error': None
+        }
+        if parent:
+            trace.enter_thread()
+        token = _span_var.set(record)
+        try:
+            yield record['attributes']
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            _span_var.reset(token)
+            if parent:
+                trace.exit_thread()
+            record['endTimeUnixNano'] = time.time_ns()
+            trace.add(record)
+
+    @staticmethod
+    def traced(name: str):
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if _trace_var.get() is None:
+                    return fn(*args, **kwargs)
+                with Tracer.span(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    @staticmethod
+    def annotate(**attributes):
+        record = _span_var.get()
+        if record is not None:
+            record['attributes'].update(attributes)
+
+    @staticmethod
+    def bind(fn):
+        ctx = contextvars.copy_context()
+        return lambda *args, **kwargs: ctx.copy().run(fn, *args, **kwargs)
+
+    @staticmethod
+    def _value(value) -> Dict:
+        if isinstance(value, bool):
+            return {'boolValue': value}
+        if isinstance(value, int):
+            return {'intValue': str(value)}
+        if isinstance(value, float):
+            return {'doubleValue': value}
+        return {'stringValue': str(value)}
+
+    @staticmethod
+    def to_otlp(trace: Trace) -> Dict:
+        spans = []
+        for record in trace.spans:
+            span = {
+                'traceId': trace.trace_id,
+                'spanId': record['spanId'],
+                'name': record['name'],
+                'kind': 2 if not record['parentSpanId'] else 1,
+                'startTimeUnixNano': str(record['startTimeUnixNano']),
+                'endTimeUnixNano': str(record['endTimeUnixNano']),
+                'attributes': [{'key': k, 'value': Tracer._value(v)} for k, v in record['attributes'].items()],
+                'status': {'code': 2, 'message': record['error']} if record['error'] else {'code': 1}
+            }
+            if record['parentSpanId']:
+                span['parentSpanId'] = record['parentSpanId']
+            spans.append(span)
+        return {'resourceSpans': [{
+            'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': 'citeguard'}}]},
+            'scopeSpans': [{'scope': {'name': 'citeguard', 'version': app.version}, 'spans': spans}]
+        }]}
+
+    @staticmethod
+    def export(trace: Trace):
+        with Tracer._exporter_lock:
+            if Tracer._exporter is None or not Tracer._exporter.is_alive():
+                Tracer._exporter = threading.Thread(target=Tracer._export_loop, daemon=True)
+                Tracer._exporter.start()
+        try:
+            Tracer._queue.put_nowait(Tracer.to_otlp(trace))
+        except queue.Full:
+            pass
+
+    @staticmethod
+    def _export_loop():
+        while True:
+            Tracer._write(Tracer._queue.get())
+
+    @staticmethod
+    def _write(payload: Dict):
+        try:
+            if TRACE_ENDPOINT:
+                req = urllib.request.Request(TRACE_ENDPOINT, data=json.dumps(payload).encode(),
+                                             headers={'Content-Type': 'application/json'})
+                urllib.request.urlopen(req, timeout=5).close()
+            else:
+                os.makedirs(os.path.dirname(TRACE_FILE) or ".", exist_ok=True)
+                with Tracer._file_lock, open(TRACE_FILE, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(payload, separators=(',', ':')) + "\n")
+        except Exception as e:
+            print(f"Trace export error: {e}")
+
+class SamplingProfiler:
+    def __init__(self, trace: Trace, interval: float):
+        self.trace = trace
+        self.interval = interval
+        self.samples = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="citeguard-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for tid in list(self.trace.threads):
+                frame = frames.get(tid)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if stack:
+                    key = ';'.join(reversed(stack))
+                    self.samples[key] = self.samples.get(key, 0) + 1
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in
+                         sorted(self.samples.items(), key=lambda item: item[1], reverse=True))
+
+class ContentCache:
+    UPSERT = ("INSERT INTO entries VALUES (?, ?, ?) "
+              "ON CONFLICT (path) DO UPDATE SET size = excluded.size, last_access = excluded.last_access")
+    
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._ready = False
+        self._init_lock = threading.Lock()
+        self._touch_lock = threading.Lock()
+        self._touched = {}
+        self._flushed = time.time()
+
+    @staticmethod
+    def key(*parts) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part if isinstance(part, bytes) else str(part).encode('utf-8'))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(namespace, key[:2], key + ".z")
+
+    def _connect(self):
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    os.makedirs(self.root, exist_ok=True)
+                    conn = sqlite3.connect(os.path.join(self.root, "index.db"), timeout=30)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS entries ("
+                        "path TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL)")
+                    conn.execute("INSERT OR IGNORE INTO totals VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM entries))")
+                    conn.execute(
+                        "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+                        "BEGIN UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0; END"
+                    )
+                    conn.execute(
+                        "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+                        "BEGIN UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0; END"
+                    )
+                    conn.execute(
+                        "CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries "
+                        "BEGIN UPDATE totals SET bytes = bytes + NEW.size - OLD.size WHERE id = 0; END"
+                    )
+                    self._backfill(conn)
+                    conn.commit()
+                    conn.close()
+                    self._ready = True
+        return sqlite3.connect(os.path.join(self.root, "index.db"), timeout=30)
+
+    def _backfill(self, conn):
+        indexed = {row[0] for row in conn.execute("SELECT path FROM entries")}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                if name.endswith(".tmp"):
+                    try:
+                        if time.time() - os.stat(path).st_mtime > 3600:
+                            os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                if not name.endswith(".z") or os.path.relpath(path, self.root) in indexed:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                conn.execute(self.UPSERT, (os.path.relpath(path, self.root), st.st_size, st.st_mtime))
+
+    def warm(self):
+        self._connect().close()
+
+    def get(self, namespace: str, key: str) -> Optional[Dict]:
+        path = self._path(namespace, key)
+        try:
+            with open(os.path.join(self.root, path), 'rb') as f:
+                value = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            print(f"Cache read error: {e}")
+            self._drop(path)
+            return None
+        now = time.time()
+        with self._touch_lock:
+            self._touched[path] = now
+            if len(self._touched) < CACHE_TOUCH_BATCH and now - self._flushed < CACHE_TOUCH_SECONDS:
+                return value
+            touched = self._take_touched()
+        try:
+            conn = self._connect()
+            with conn:
+                self._touch(conn, touched)
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Cache index error: {e}")
+        return value
+
+    def _take_touched(self) -> Dict[str, float]:
+        touched, self._touched = self._touched, {}
+        self._flushed = time.time()
+        return touched
+
+    def _touch(self, conn, touched: Dict[str, float]):
+        conn.executemany("UPDATE entries SET last_access = MAX(last_access, ?) WHERE path = ?",
+                         [(at, path) for path, at in touched.items()])
+
+    def put(self, namespace: str, key: str, value: Dict):
+        self.put_many(namespace, {key: value})
+
+    def put_many(self, namespace: str, values: Dict[str, Dict]):
+        entries = []
+        for key, value in values.items():
+            data = zlib.compress(json.dumps(value).encode('utf-8'), 6)
+            if len(data) <= self.max_bytes:
+                entries.append((self._path(namespace, key), data))
+        if not entries:
+            return
+        now = time.time()
+        try:
+            with self._touch_lock:
+                touched = self._take_touched()
+            conn = self._connect()
+            with conn:
+                self._touch(conn, touched)
+                conn.executemany(self.UPSERT, [(path, len(data), now) for path, data in entries])
+                self._evict(conn, now)
+            conn.close()
+            for path, data in entries:
+                full = os.path.join(self.root, path)
+                os.makedirs(os.path.dirname(full), exist_ok=True)
+                tmp = f"{full}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, full)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Cache write error: {e}")
+
+    def _evict(self, conn, before: float):
+        total = conn.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * CACHE_EVICT_TARGET
+        while total > target:
+            rows = conn.execute(
+                "SELECT path, size FROM entries WHERE last_access < ? ORDER BY last_access LIMIT 64", (before,)
+            ).fetchall()
+            if not rows:
+                break
+            for path, size in rows:
+                if total <= target:
+                    break
+                conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+                try:
+                    os.remove(os.path.join(self.root, path))
+                except OSError:
+                    pass
+                total -= size
+
+    def _drop(self, path: str):
+        try:
+            os.remove(os.path.join(self.root, path))
+        except OSError:
+            pass
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+content_cache = ContentCache(CACHE_DIR, CACHE_MAX_BYTES)
+
+class UpstreamTracker:
+    def __init__(self):
+        self._idle = threading.Condition()
+        self._in_flight = 0
+
+    @contextmanager
+    def open(self, req, context=None, timeout=10):
+        with self._idle:
+            self._in_flight += 1
+        url = req if isinstance(req, str) else req.full_url
+        try:
+            with Tracer.span("upstream", **{'http.url': url.split('?')[0]}) as attrs:
+                start = time.perf_counter()
+                with urllib.request.urlopen(req, context=context, timeout=timeout) as response:
+                    if attrs is not None:
+                        attrs['http.status_code'] = response.status
+                        attrs['http.ttfb_ms'] = round((time.perf_counter() - start) * 1000, 1)
+                    yield response
+        finally:
+            with self._idle:
+                self._in_flight -= 1
+                if not self._in_flight:
+                    self._idle.notify_all()
+
+    def wait_idle(self, timeout: float) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._in_flight, timeout)
+
+upstream = UpstreamTracker()
+
+class RateLimiter:
+    def __init__(self, name: str, per_second: float, path: str):
+        self.name = name
+        self.interval = 1.0 / per_second
+        self.path = path
+        self._lock = threading.Lock()
+        self._next = 0.0
+        self._ready = False
+
+    def _connect(self):
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS slots (name TEXT PRIMARY KEY, next REAL NOT NULL)")
+            self._ready = True
+        return conn
+
+    def _reserve(self, now: float) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT next FROM slots WHERE name = ?", (self.name,)).fetchone()
+            start = max(now, row[0] if row else 0.0)
+            conn.execute("INSERT OR REPLACE INTO slots VALUES (?, ?)", (self.name, start + self.interval))
+            conn.execute("COMMIT")
+            return start
+        finally:
+            conn.close()
+
+    def wait(self):
+        with self._lock:
+            now = time.time()
+            try:
+                start = self._reserve(now)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Rate limiter error: {e}")
+                start = max(now, self._next)
+            self._next = start + self.interval
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+RATE_DB = os.path.join(DATA_DIR, "rates.db")
+RATE_LIMITS = {
+    'pubmed': RateLimiter('pubmed', 3, RATE_DB),
+    'semantic_scholar': RateLimiter('semantic_scholar', 1, RATE_DB),
+    'wikipedia': RateLimiter('wikipedia', 10, RATE_DB)
+}
+
 class RealAPIs:
     @staticmethod
-    def pubmed(query: str) -> List[Dict]:
+    @Tracer.traced("provider.lookup")
+    def lookup(provider: str, query: str, offset: int = 0, limit: int = PROVIDER_PAGE_SIZE) -> List[Dict]:
+        Tracer.annotate(provider=provider, offset=offset, limit=limit)
+        cached = RealAPIs.cached_page(provider, query, offset, limit)
+        Tracer.annotate(cache_hit=bool(cached))
+        if cached:
+            return cached['results']
+        results = getattr(RealAPIs, provider)(query, offset, limit)
+        if results:
+            content_cache.put("api", RealAPIs.cache_key(provider, query, offset, limit),
+                              {'results': results, 'fetched_at': time.time()})
+        return results
+    
+    @staticmethod
+    def cached_page(provider: str, query: str, offset: int, limit: int) -> Optional[Dict]:
+        now = time.time()
+        for size in dict.fromkeys((limit, PROVIDER_PAGE_SIZE)):
+            cached = content_cache.get("api", RealAPIs.cache_key(provider, query, offset, size))
+            if cached and now - cached['fetched_at'] < API_CACHE_SECONDS:
+                return dict(cached, results=cached['results'][:limit])
+        return None
+    
+    @staticmethod
+    def cache_key(provider: str, query: str, offset: int, limit: int) -> str:
+        return ContentCache.key(provider, ' '.join(query.lower().split()), offset, limit)
+    
+    @staticmethod
+    def pages(windows: Dict[str, tuple]) -> List[tuple]:
+        pages = []
+        for provider, (offset, count) in windows.items():
+            if offset == 0 and count < PROVIDER_PAGE_SIZE:
+                pages.append((provider, 0, count))
+                continue
+            first = offset - offset % PROVIDER_PAGE_SIZE
+            pages.extend((provider, start, PROVIDER_PAGE_SIZE)
+                         for start in range(first, offset + count, PROVIDER_PAGE_SIZE))
+        return pages
+    
+    @staticmethod
+    def search(query: str, windows: Dict[str, tuple]) -> Dict[str, tuple]:
+        pages = RealAPIs.pages(windows)
+        
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, min(PAGE_MAX_PARALLEL, len(pages)))) as pool:
+            fetched = dict(zip(pages, pool.map(Tracer.bind(lambda page: RealAPIs.lookup(page[0], query, page[1], page[2])), pages)))
+        
+        found = {}
+        for provider, (offset, count) in windows.items():
+            first = offset - offset % PROVIDER_PAGE_SIZE
+            items = []
+            exhausted = False
+            for page in (p for p in pages if p[0] == provider):
+                results = fetched[page]
+                items.extend(results)
+                if len(results) < page[2]:
+                    exhausted = True
+                    break
+            available = items[offset - first:]
+            results = available[:count]
+            more = len(available) > count or not exhausted
+            found[provider] = (results, offset + len(results) if more else None)
+        return found
+    
+    @staticmethod
+    def pubmed(query: str, offset: int = 0, limit: int = PROVIDER_PAGE_SIZE) -> List[Dict]:
         try:
             encoded = urllib.parse.quote(query)
-            url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pubmed&term={encoded}&retmode=json&retmax=2"
+            url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pubmed&term={encoded}&retmode=json&retstart={offset}&retmax={limit}"
             ctx = ssl.create_default_context()
-            with urllib.request.urlopen(url, context=ctx, timeout=10) as response:
+            RATE_LIMITS['pubmed'].wait()
+            with upstream.open(url, context=ctx, timeout=10) as response:
                 data = json.loads(response.read().decode())
                 pmids = data.get('esearchresult', {}).get('idlist', [])
-                results = []
-                for pmid in pmids:
-                    sum_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&id={pmid}&retmode=json"
-                    with urllib.request.urlopen(sum_url, context=ctx, timeout=10) as sum_response:
-                        sum_data = json.loads(sum_response.read().decode())
-                        docs = sum_data.get('result', {})
-                        if pmid in docs:
-                            doc = docs[pmid]
-                            authors = doc.get('authors', [])
-                            author = authors[0].get('name', 'Unknown') if authors else 'Unknown'
-                            results.append({
-                                'id': f"pubmed_{pmid}",
-                                'title': doc.get('title', 'Unknown'),
-                                'authors': author,
-                                'publisher': 'PubMed/NCBI',
-                                'date': doc.get('pubdate', 'Unknown'),
-                                'url': f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-                                'type': 'peer_reviewed',
-                                'credibility': 1.0
-                            })
-                return results
+            if not pmids:
+                return []
+            sum_url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&id={','.join(pmids)}&retmode=json"
+            RATE_LIMITS['pubmed'].wait()
+            with upstream.open(sum_url, context=ctx, timeout=10) as sum_response:
+                docs = json.loads(sum_response.read().decode()).get('result', {})
+            results = []
+            for pmid in pmids:
+                if pmid in docs:
+                    doc = docs[pmid]
+                    authors = doc.get('authors', [])
+                    author = authors[0].get('name', 'Unknown') if authors else 'Unknown'
+                    results.append({
+                        'id': f"pubmed_{pmid}",
+                        'title': doc.get('title', 'Unknown'),
+                        'authors': author,
+                        'publisher': 'PubMed/NCBI',
+                        'date': doc.get('pubdate', 'Unknown'),
+                        'url': f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+                        'type': 'peer_reviewed',
+                        'credibility': 1.0
+                    })
+            return results
         except Exception as e:
             print(f"PubMed error: {e}")
             return []
     
     @staticmethod
-    def semantic_scholar(query: str) -> List[Dict]:
+    def semantic_scholar(query: str, offset: int = 0, limit: int = PROVIDER_PAGE_SIZE) -> List[Dict]:
         try:
             encoded = urllib.parse.quote(query)
-            url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={encoded}&fields=title,authors,year,url&limit=2"
+            url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={encoded}&fields=paperId,title,authors,year,url,abstract&offset={offset}&limit={limit}"
             ctx = ssl.create_default_context()
             req = urllib.request.Request(url, headers={'Accept': 'application/json'})
-            with urllib.request.urlopen(req, context=ctx, timeout=10) as response:
+            RATE_LIMITS['semantic_scholar'].wait()
+            with upstream.open(req, context=ctx, timeout=10) as response:
                 data = json.loads(response.read().decode())
                 papers = data.get('data', [])
                 results = []
@@ -127,6 +1067,7 @@ class RealAPIs:
                     results.append({
                         'id': f"ss_{paper.get('paperId', 'unknown')}",
                         'title': paper.get('title', 'Unknown'),
+                        'abstract': paper.get('abstract') or '',
                         'authors': author,
                         'publisher': 'Semantic Scholar',
                         'date': str(paper.get('year', 'Unknown')),
@@ -140,12 +1081,81 @@ class RealAPIs:
             return []
     
     @staticmethod
-    def wikipedia(query: str) -> List[Dict]:
+    def pubmed_abstracts(pmids: List[str]) -> Dict[str, str]:
+        abstracts = {}
+        try:
+            ctx = ssl.create_default_context()
+            for i in range(0, len(pmids), ABSTRACT_BATCH_SIZE):
+                batch = pmids[i:i + ABSTRACT_BATCH_SIZE]
+                url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubmed&id={','.join(batch)}&rettype=abstract&retmode=xml"
+                RATE_LIMITS['pubmed'].wait()
+                with upstream.open(url, context=ctx, timeout=15) as response:
+                    from xml.etree import ElementTree
+                    root = ElementTree.fromstring(response.read())
+                for article in root.iter('PubmedArticle'):
+                    pmid = article.findtext('MedlineCitation/PMID')
+                    parts = [''.join(node.itertext()).strip() for node in article.iter('AbstractText')]
+                    if pmid:
+                        abstracts[pmid] = ' '.join(p for p in parts if p)
+        except Exception as e:
+            print(f"PubMed efetch error: {e}")
+        return abstracts
+    
+    @staticmethod
+    def semantic_scholar_abstracts(paper_ids: List[str]) -> Dict[str, str]:
+        abstracts = {}
+        try:
+            ctx = ssl.create_default_context()
+            for i in range(0, len(paper_ids), ABSTRACT_BATCH_SIZE):
+                batch = paper_ids[i:i + ABSTRACT_BATCH_SIZE]
+                req = urllib.request.Request(
+                    "https://api.semanticscholar.org/graph/v1/paper/batch?fields=paperId,abstract",
+                    data=json.dumps({'ids': batch}).encode(),
+                    headers={'Accept': 'application/json', 'Content-Type': 'application/json'}
+                )
+                RATE_LIMITS['semantic_scholar'].wait()
+                with upstream.open(req, context=ctx, timeout=15) as response:
+                    papers = json.loads(response.read().decode())
+                for paper in papers:
+                    if paper and paper.get('paperId'):
+                        abstracts[paper['paperId']] = paper.get('abstract') or ''
+        except Exception as e:
+            print(f"Semantic Scholar batch error: {e}")
+        return abstracts
+    
+    @staticmethod
+    @Tracer.traced("provider.abstracts")
+    def abstracts(results: List[Dict]) -> Dict[str, str]:
+        found = {}
+        missing = {'pubmed_': [], 'ss_': []}
+        for r in results:
+            if 'abstract' in r:
+                found[r['id']] = r['abstract']
+                continue
+            cached = content_cache.get("paper", ContentCache.key(r['id']))
+            if cached is not None:
+                found[r['id']] = cached['abstract']
+            else:
+                for prefix in missing:
+                    if r['id'].startswith(prefix):
+                        missing[prefix].append(r['id'][len(prefix):])
+        fetched = {}
+        if missing['pubmed_']:
+            fetched.update({f"pubmed_{k}": v for k, v in RealAPIs.pubmed_abstracts(missing['pubmed_']).items()})
+        if missing['ss_']:
+            fetched.update({f"ss_{k}": v for k, v in RealAPIs.semantic_scholar_abstracts(missing['ss_']).items()})
+        content_cache.put_many("paper", {ContentCache.key(k): {'abstract': v} for k, v in fetched.items()})
+        found.update(fetched)
+        return found
+    
+    @staticmethod
+    def wikipedia(query: str, offset: int = 0, limit: int = PROVIDER_PAGE_SIZE) -> List[Dict]:
         try:
             encoded = urllib.parse.quote(query)
-            url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={encoded}&format=json&srlimit=2"
+            url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={encoded}&format=json&sroffset={offset}&srlimit={limit}"
             ctx = ssl.create_default_context()
-            with urllib.request.urlopen(url, context=ctx, timeout=10) as response:
+            RATE_LIMITS['wikipedia'].wait()
+            with upstream.open(url, context=ctx, timeout=10) as response:
                 data = json.loads(response.read().decode())
                 search_results = data.get('query', {}).get('search', [])
                 results = []
@@ -169,21 +1179,53 @@ class RealAPIs:
             return []
 
 class PDFProcessor:
+    _module = None
+    _module_lock = threading.Lock()
+    
+    @staticmethod
+    def library():
+        if PDFProcessor._module is None:
+            with PDFProcessor._module_lock:
+                if PDFProcessor._module is None:
+                    try:
+                        import pypdf as module
+                    except ImportError:
+                        try:
+                            import PyPDF2 as module
+                        except ImportError:
+                            module = False
+                    PDFProcessor._module = module
+        return PDFProcessor._module or None
+    
+    @staticmethod
+    def loaded() -> bool:
+        return bool(PDFProcessor._module)
+    
+    @staticmethod
+    @Tracer.traced("pdf.extract")
+    def extract_pages(file_bytes: bytes) -> List[str]:
+        pdf = PDFProcessor.library()
+        if not pdf:
+            return []
+        key = ContentCache.key(file_bytes)
+        cached = content_cache.get("pdf", key)
+        if cached is not None:
+            return cached['pages']
+        import io
+        reader = pdf.PdfReader(io.BytesIO(file_bytes))
+        pages = [page.extract_text() or "" for page in reader.pages]
+        content_cache.put("pdf", key, {'pages': pages})
+        return pages
+
     @staticmethod
     def extract(file_bytes: bytes) -> str:
-        if not PDF_SUPPORT:
-            return ""
         try:
-            import io
-            reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
-            return text[:15000]
+            return "".join(PDFProcessor.extract_pages(file_bytes))[:15000]
         except Exception as e:
             return f"Error: {str(e)}"
     
     @staticmethod
+    @Tracer.traced("match")
     def find_citations(text: str, claim: str) -> List[Dict]:
         sentences = re.split(r'[.!?]+', text)
         claim_words = set(claim.lower().split())
@@ -208,23 +1250,53 @@ class PDFProcessor:
 
 class URLProcessor:
     @staticmethod
+    @Tracer.traced("url.fetch")
     def fetch(url: str) -> Dict:
+        key = ContentCache.key(url)
+        cached = content_cache.get("url", key)
+        if cached and time.time() - cached['checked_at'] < URL_FRESH_SECONDS:
+            return {'success': True, 'title': cached['title'], 'url': url, 'content': cached['content']}
+        headers = {'User-Agent': 'Mozilla/5.0 (Research Bot)'}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
         try:
             ctx = ssl.create_default_context()
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (Research Bot)'})
-            with urllib.request.urlopen(req, context=ctx, timeout=15) as response:
+            req = urllib.request.Request(url, headers=headers)
+            with upstream.open(req, context=ctx, timeout=15) as response:
                 html = response.read().decode('utf-8', errors='ignore')
-                title_match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE)
-                title = title_match.group(1).strip() if title_match else url
-                text = re.sub(r'<script.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-                text = re.sub(r'<style.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-                text = re.sub(r'<[^>]+>', ' ', text)
-                text = re.sub(r'\s+', ' ', text).strip()
-                return {'success': True, 'title': title, 'url': url, 'content': text[:10000]}
+                title, text = URLProcessor.extract(html, url)
+                content_cache.put("url", key, {
+                    'title': title,
+                    'content': text,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'checked_at': time.time()
+                })
+                return {'success': True, 'title': title, 'url': url, 'content': text}
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                cached['checked_at'] = time.time()
+                content_cache.put("url", key, cached)
+                return {'success': True, 'title': cached['title'], 'url': url, 'content': cached['content']}
+            return {'success': False, 'error': str(e)}
         except Exception as e:
             return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    @Tracer.traced("url.extract")
+    def extract(html: str, url: str):
+        title_match = re.search(r'<title>(.*?)</title>', html, re.IGNORECASE)
+        title = title_match.group(1).strip() if title_match else url
+        text = re.sub(r'<script.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r'<style.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = re.sub(r'<[^>]+>', ' ', text)
+        text = re.sub(r'\s+', ' ', text).strip()
+        return title, text[:10000]
     
     @staticmethod
+    @Tracer.traced("match")
     def find_citations(content: str, claim: str) -> List[Dict]:
         sentences = re.split(r'[.!?]+', content)
         claim_words = set(claim.lower().split())
@@ -245,6 +1317,12 @@ class URLProcessor:
 
 class TextProcessor:
     @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        sentences = re.split(r'(?<=[.!?])\s+', re.sub(r'\s+', ' ', text))
+        return [s.strip() for s in sentences if s.strip()]
+    
+    @staticmethod
+    @Tracer.traced("match")
     def find_citations(text: str, claim: str) -> List[Dict]:
         sentences = re.split(r'[.!?]+', text)
         claim_words = set(claim.lower().split())
@@ -259,67 +1337,240 @@ class TextProcessor:
                 para_start = max(0, i-3)
                 para_end = min(len(sentences), i+4)
                 context = ' '.join(sentences[para_start:para_end])
-                negations = ['not', 'no', 'never', 'false', 'incorrect', 'wrong', 'does not', "isn't", 'isnt']
-                has_negation = any(neg in sent_lower for neg in negations)
                 citations.append({
                     'quote': sentence,
                     'context': context,
                     'paragraph': (i // 5) + 1,
-                    'relevance': min(0.95, 0.5 + matches * 0.2),
-                    'supports': not has_negation
+                    'relevance': min(0.95, 0.5 + matches * 0.2)
                 })
         return sorted(citations, key=lambda x: x['relevance'], reverse=True)[:5]
 
+class StanceClassifier:
+    NEGATION_CUES = {
+        'not', 'no', 'never', 'none', 'neither', 'nor', 'cannot', 'without', 'nothing', 'nobody',
+        'isnt', 'arent', 'wasnt', 'werent', 'dont', 'doesnt', 'didnt', 'wont', 'cant', 'couldnt',
+        'shouldnt', 'wouldnt', 'hasnt', 'havent', 'hadnt', 'lack', 'lacks', 'fail', 'fails', 'failed'
+    }
+    REFUTATION_CUES = {
+        'false', 'incorrect', 'wrong', 'myth', 'debunked', 'refuted', 'disproven', 'disproved',
+        'unfounded', 'baseless', 'misconception', 'hoax', 'untrue', 'inaccurate'
+    }
+    NON_NEGATING = {('not', 'only'), ('not', 'just'), ('not', 'merely'), ('not', 'simply'), ('no', 'doubt')}
+    CONTRARY_CUES = {'otherwise', 'contrary', 'opposite'}
+    SCOPE_BREAKS = {'but', 'however', 'although', 'though', 'whereas', 'while', 'yet'}
+    STOPWORDS = {
+        'a', 'an', 'the', 'is', 'are', 'was', 'were', 'be', 'been', 'being', 'of', 'in', 'on', 'at', 'to',
+        'for', 'by', 'with', 'and', 'or', 'that', 'this', 'these', 'those', 'it', 'its', 'as', 'from',
+        'do', 'does', 'did', 'has', 'have', 'had', 'can', 'will', 'would', 'may', 'than', 'then', 'there'
+    }
+    SCOPE = 6
+    MIN_OVERLAP = 0.34
+    
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    _model = None
+    _model_lock = threading.Lock()
+    
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        tokens = []
+        for tok in re.findall(r"[a-z0-9]+(?:'[a-z]+)?|[,;:]", text.lower()):
+            tok = tok.replace("n't", "nt").replace("'", "")
+            if len(tok) > 4 and tok.endswith('s') and not tok.endswith('ss'):
+                tok = tok[:-1]
+            tokens.append(tok)
+        return tokens
+    
+    @staticmethod
+    def negated_terms(tokens: List[str]) -> set:
+        negated = set()
+        scope = 0
+        for i, tok in enumerate(tokens):
+            if tuple(tokens[i:i + 2]) in StanceClassifier.NON_NEGATING:
+                continue
+            if tok in StanceClassifier.NEGATION_CUES:
+                scope = StanceClassifier.SCOPE
+            elif tok in StanceClassifier.SCOPE_BREAKS or tok in {',', ';', ':'}:
+                scope = 0
+            elif scope:
+                negated.add(tok)
+                scope -= 1
+        return negated
+    
+    @staticmethod
+    def clauses(tokens: List[str]) -> List[List[str]]:
+        clauses = [[]]
+        for tok in tokens:
+            if tok in StanceClassifier.SCOPE_BREAKS or tok in {',', ';', ':'}:
+                clauses.append([])
+            else:
+                clauses[-1].append(tok)
+        return [c for c in clauses if c]
+    
+    @staticmethod
+    def negated(terms: set, tokens: List[str]) -> bool:
+        clauses = StanceClassifier.clauses(tokens)
+        best, best_hits = False, 0
+        for i, clause in enumerate(clauses):
+            hits = len(terms & set(clause))
+            if hits <= best_hits:
+                continue
+            polarity = bool(terms & StanceClassifier.negated_terms(clause))
+            polarity ^= bool(StanceClassifier.REFUTATION_CUES & set(clause))
+            following = clauses[i + 1] if i + 1 < len(clauses) else []
+            if (StanceClassifier.REFUTATION_CUES & set(following) and not terms & set(following)
+                    and not StanceClassifier.CONTRARY_CUES & set(following)):
+                polarity = not polarity
+            best, best_hits = polarity, hits
+        return best
+    
+    @staticmethod
+    def _heuristic(claim: str, sentence: str) -> Dict:
+        claim_tokens = StanceClassifier.tokenize(claim)
+        terms = {t for t in claim_tokens if t.isalnum() and t not in StanceClassifier.STOPWORDS
+                 and t not in StanceClassifier.NEGATION_CUES}
+        sent_tokens = StanceClassifier.tokenize(sentence)
+        if not terms:
+            return {'stance': 'neutral', 'score': 0.0}
+        overlap = len(terms & set(sent_tokens)) / len(terms)
+        if overlap < StanceClassifier.MIN_OVERLAP:
+            return {'stance': 'neutral', 'score': round(overlap, 2)}
+        claim_neg = StanceClassifier.negated(terms, claim_tokens)
+        sent_neg = StanceClassifier.negated(terms, sent_tokens)
+        stance = 'contradict' if claim_neg != sent_neg else 'support'
+        return {'stance': stance, 'score': round(overlap, 2)}
+    
+    @staticmethod
+    def _load_model():
+        if not NLI_MODEL:
+            return None
+        with StanceClassifier._model_lock:
+            if StanceClassifier._model is None:
+                try:
+                    from transformers import pipeline
+                    StanceClassifier._model = pipeline("text-classification", model=NLI_MODEL, device=-1)
+                except Exception as e:
+                    print(f"NLI model unavailable, using negation scope only: {e}")
+                    StanceClassifier._model = False
+            return StanceClassifier._model or None
+    
+    @staticmethod
+    def _nli(model, claim: str, sentences: List[str]) -> List[Dict]:
+        inputs = [{'text': s, 'text_pair': claim} for s in sentences]
+        outputs = model(inputs, batch_size=NLI_BATCH_SIZE, truncation=True)
+        results = []
+        for out in outputs:
+            label = out['label'].lower()
+            if 'contradict' in label:
+                results.append({'stance': 'contradict', 'score': round(out['score'], 2)})
+            elif 'entail' in label:
+                results.append({'stance': 'support', 'score': round(out['score'], 2)})
+            else:
+                results.append({'stance': 'neutral', 'score': round(out['score'], 2)})
+        return results
+    
+    @staticmethod
+    @Tracer.traced("stance")
+    def classify(claim: str, sentences: List[str]) -> List[Dict]:
+        results = [None] * len(sentences)
+        keys = [ContentCache.key(claim, s) for s in sentences]
+        with StanceClassifier._cache_lock:
+            for i, key in enumerate(keys):
+                if key in StanceClassifier._cache:
+                    StanceClassifier._cache.move_to_end(key)
+                    results[i] = StanceClassifier._cache[key]
+        
+        pending = [i for i, r in enumerate(results) if r is None]
+        for i in pending:
+            results[i] = StanceClassifier._heuristic(claim, sentences[i])
+        
+        model = StanceClassifier._load_model() if pending else None
+        if model:
+            batch = [i for i in pending if results[i]['stance'] != 'neutral']
+            if batch:
+                try:
+                    for i, verdict in zip(batch, StanceClassifier._nli(model, claim, [sentences[i] for i in batch])):
+                        results[i] = verdict
+                except Exception as e:
+                    print(f"NLI error: {e}")
+        
+        with StanceClassifier._cache_lock:
+            for i in pending:
+                StanceClassifier._cache[keys[i]] = results[i]
+            while len(StanceClassifier._cache) > STANCE_CACHE_SIZE:
+                StanceClassifier._cache.popitem(last=False)
+        return results
+
+class ClaimDetector:
+    FACTUAL_CUES = re.compile(
+        r'\b(cause[sd]?|causing|increase[sd]?|decrease[sd]?|reduce[sd]?|prevent[sd]?|lead[s]? to|led to|'
+        r'result(?:s|ed)? in|associated with|linked to|risk|effective|more than|less than|fewer than|'
+        r'majority|most|percent|rate|average|doubled?|tripled?|according to|study|studies|found|shows?|showed)\b',
+        re.IGNORECASE
+    )
+    OPINION_CUES = re.compile(
+        r'\b(i think|i believe|we believe|in my opinion|perhaps|maybe|might|could be|should|hopefully|'
+        r'click here|subscribe|copyright)\b',
+        re.IGNORECASE
+    )
+    
+    @staticmethod
+    def score(sentence: str) -> float:
+        words = sentence.split()
+        if len(words) < 6 or len(words) > 60 or sentence.endswith('?'):
+            return 0.0
+        score = 0.2
+        if re.search(r'\d', sentence):
+            score += 0.3
+        if '%' in sentence or re.search(r'\bpercent\b', sentence, re.IGNORECASE):
+            score += 0.1
+        score += min(0.4, 0.2 * len(ClaimDetector.FACTUAL_CUES.findall(sentence)))
+        if re.search(r'\b[A-Z][a-z]+\b', ' '.join(words[1:])):
+            score += 0.1
+        if ClaimDetector.OPINION_CUES.search(sentence):
+            score -= 0.4
+        return round(max(0.0, min(1.0, score)), 2)
+    
+    @staticmethod
+    def detect(sentences: List[str], limit: int, threshold: float = 0.5) -> List[Dict]:
+        candidates = []
+        for i, sentence in enumerate(sentences):
+            score = ClaimDetector.score(sentence)
+            if score >= threshold:
+                candidates.append({'index': i, 'sentence': sentence, 'score': score})
+        candidates.sort(key=lambda c: c['score'], reverse=True)
+        return sorted(candidates[:limit], key=lambda c: c['index'])
+
 class VerificationEngine:
     def __init__(self):
         self.apis = RealAPIs()
     
-    def verify_apis(self, claim: str, domain: str = "general") -> VerifiedResult:
+    @Tracer.traced("verify.api")
+    def verify_apis(self, claim: str, domain: str = "general", max_results: Optional[Dict[str, int]] = None,
+                    cursor: Optional[str] = None) -> VerifiedResult:
+        offsets = self._decode_cursor(cursor, claim) if cursor else None
+        found = self.apis.search(claim, self.windows(claim, domain, max_results, offsets))
+        
         all_citations = []
         sources_info = []
         
-        if domain in ["general", "academic", "medical"]:
-            pubmed_results = self.apis.pubmed(claim)
-            for r in pubmed_results:
-                sources_info.append(SourceInfo(
-                    name=r['publisher'],
-                    type=r['type'],
-                    url=r['url'],
-                    credibility_score=r['credibility'],
-                    date_accessed=datetime.now().isoformat()
-                ))
-                all_citations.append(Citation(
-                    quote=f"Research: {r['title']}",
-                    context=f"Authors: {r['authors']}. Published: {r['date']}",
-                    source_title=r['title'],
-                    source_publisher=r['publisher'],
-                    source_type=r['type'],
-                    source_url=r['url'],
-                    relevance_score=0.85,
-                    access_date=datetime.now().isoformat()
-                ))
+        pubmed_results = found.get('pubmed', ([], None))[0]
+        ss_results = found.get('semantic_scholar', ([], None))[0]
+        if pubmed_results or ss_results:
+            abstracts = self.apis.abstracts(pubmed_results + ss_results)
             
-            ss_results = self.apis.semantic_scholar(claim)
-            for r in ss_results:
-                sources_info.append(SourceInfo(
-                    name=r['publisher'],
-                    type=r['type'],
-                    url=r['url'],
-                    credibility_score=r['credibility'],
-                    date_accessed=datetime.now().isoformat()
-                ))
-                all_citations.append(Citation(
-                    quote=f"Study: {r['title']}",
-                    context=f"Published: {r['date']}. Authors: {r['authors']}",
-                    source_title=r['title'],
-                    source_publisher=r['publisher'],
-                    source_type=r['type'],
-                    source_url=r['url'],
-                    relevance_score=0.9,
-                    access_date=datetime.now().isoformat()
-                ))
-        
-        wiki_results = self.apis.wikipedia(claim)
+            for label, results in (("Research", pubmed_results), ("Study", ss_results)):
+                for r in results:
+                    sources_info.append(SourceInfo(
+                        name=r['publisher'],
+                        type=r['type'],
+                        url=r['url'],
+                        credibility_score=r['credibility'],
+                        date_accessed=datetime.now().isoformat()
+                    ))
+                    all_citations.extend(self._paper_citations(claim, r, abstracts.get(r['id']), label))
+        
+        wiki_results = found.get('wikipedia', ([], None))[0]
         for r in wiki_results:
             sources_info.append(SourceInfo(
                 name=r['publisher'],
@@ -339,6 +1590,8 @@ class VerificationEngine:
                 access_date=datetime.now().isoformat()
             ))
         
+        all_citations, contradicting = self._split_stance(claim, all_citations)
+        
         if all_citations:
             avg_rel = sum(c.relevance_score for c in all_citations) / len(all_citations)
             avg_cred = sum(s.credibility_score for s in sources_info) / len(sources_info)
@@ -354,8 +1607,9 @@ class VerificationEngine:
             status = VerificationStatus.UNVERIFIABLE
         else:
             status = VerificationStatus.NO_EVIDENCE
+        status, confidence = self._apply_contradiction(status, confidence, all_citations, contradicting)
         
-        explanation = self._explain(claim, status, confidence, all_citations, "Real APIs")
+        explanation = self._explain(claim, status, confidence, all_citations, "Real APIs", contradicting)
         
         return VerifiedResult(
             original_claim=claim,
@@ -363,26 +1617,67 @@ class VerificationEngine:
             confidence=confidence,
             citations=all_citations,
             sources_used=sources_info,
-            contradictory_evidence=[],
+            contradictory_evidence=contradicting,
             explanation=explanation,
             total_sources_checked=len(sources_info),
-            verification_method="api"
+            verification_method="api",
+            next_cursor=self._encode_cursor(claim, {p: nxt for p, (_, nxt) in found.items() if nxt is not None})
         )
     
-    def verify_pdf(self, file_bytes: bytes, filename: str, claim: str) -> VerifiedResult:
+    @staticmethod
+    def windows(claim: str, domain: str, max_results: Optional[Dict[str, int]] = None,
+                offsets: Optional[Dict[str, int]] = None) -> Dict[str, tuple]:
+        providers = PROVIDERS if domain in ["general", "academic", "medical"] else ('wikipedia',)
+        if offsets is None:
+            offsets = {p: 0 for p in providers}
+        depth = dict.fromkeys(providers, DEFAULT_MAX_RESULTS)
+        for provider, count in (max_results or {}).items():
+            if provider not in PROVIDERS or not 1 <= count <= MAX_RESULTS_LIMIT:
+                raise ValueError(f"max_results expects {', '.join(PROVIDERS)} between 1 and {MAX_RESULTS_LIMIT}")
+            depth[provider] = count
+        return {p: (offsets[p], depth[p]) for p in providers if p in offsets}
+    
+    def _encode_cursor(self, claim: str, offsets: Dict[str, int]) -> Optional[str]:
+        if not offsets:
+            return None
+        payload = json.dumps({'c': ContentCache.key(claim)[:16], 'o': offsets}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+    
+    def _decode_cursor(self, cursor: str, claim: str) -> Dict[str, int]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            offsets = {p: int(o) for p, o in payload['o'].items() if p in PROVIDERS}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise ValueError("Invalid cursor")
+        if any(not 0 <= o <= MAX_CURSOR_OFFSET for o in offsets.values()):
+            raise ValueError("Invalid cursor")
+        if payload.get('c') != ContentCache.key(claim)[:16]:
+            raise ValueError("Cursor belongs to a different claim")
+        return offsets
+    
+    def _paper_citations(self, claim: str, paper: Dict, abstract: Optional[str], label: str) -> List[Citation]:
+        found = PDFProcessor.find_citations(abstract, claim)[:ABSTRACT_CITATIONS_PER_PAPER] if abstract else []
+        section = "Abstract"
+        if not found:
+            found = [dict(f, quote=f"{label}: {paper['title']}", context=f"Authors: {paper['authors']}. Published: {paper['date']}")
+                     for f in PDFProcessor.find_citations(paper['title'], claim)[:1]]
+            section = "Title"
+        return [Citation(
+            quote=f['quote'],
+            context=f['context'],
+            source_title=paper['title'],
+            source_publisher=paper['publisher'],
+            source_type=paper['type'],
+            source_url=paper['url'],
+            section=section,
+            relevance_score=f['relevance'],
+            access_date=datetime.now().isoformat()
+        ) for f in found]
+    
+    def _pdf_evidence(self, file_bytes: bytes, filename: str, claim: str):
         text = PDFProcessor.extract(file_bytes)
         if not text or text.startswith("Error"):
-            return VerifiedResult(
-                original_claim=claim,
-                status=VerificationStatus.NO_EVIDENCE,
-                confidence=0.0,
-                citations=[],
-                sources_used=[],
-                contradictory_evidence=[],
-                explanation=f"PDF Error: {text}",
-                total_sources_checked=0,
-                verification_method="pdf"
-            )
+            return None, [], f"PDF Error: {text}"
         
         found = PDFProcessor.find_citations(text, claim)
         source_info = SourceInfo(
@@ -405,15 +1700,86 @@ class VerificationEngine:
                 relevance_score=f['relevance'],
                 access_date=datetime.now().isoformat()
             ))
+        return source_info, citations, None
+    
+    def _url_evidence(self, url: str, claim: str):
+        page = URLProcessor.fetch(url)
+        if not page['success']:
+            return None, [], f"URL Error: {page.get('error')}"
+        
+        found = URLProcessor.find_citations(page['content'], claim)
+        source_info = SourceInfo(
+            name=page['title'],
+            type="scraped_webpage",
+            url=url,
+            credibility_score=0.6,
+            date_accessed=datetime.now().isoformat()
+        )
+        
+        citations = []
+        for f in found:
+            citations.append(Citation(
+                quote=f['quote'],
+                context=f['context'],
+                source_title=page['title'],
+                source_publisher=url[:60] + "...",
+                source_type="scraped",
+                source_url=url,
+                relevance_score=f['relevance'],
+                access_date=datetime.now().isoformat()
+            ))
+        return source_info, citations, None
+    
+    def _text_evidence(self, text: str, source_name: str, claim: str):
+        found = TextProcessor.find_citations(text, claim)
+        source_info = SourceInfo(
+            name=source_name,
+            type="pasted_text",
+            url=None,
+            credibility_score=0.85,
+            date_accessed=datetime.now().isoformat()
+        )
+        
+        citations = []
+        for f in found:
+            citations.append(Citation(
+                quote=f['quote'],
+                context=f['context'],
+                source_title=source_name,
+                source_publisher="User Provided Text",
+                source_type="pasted",
+                section=f"Paragraph {f.get('paragraph', 'Unknown')}",
+                relevance_score=f['relevance'],
+                access_date=datetime.now().isoformat()
+            ))
+        return source_info, citations, None
+    
+    @Tracer.traced("verify.pdf")
+    def verify_pdf(self, file_bytes: bytes, filename: str, claim: str) -> VerifiedResult:
+        source_info, citations, error = self._pdf_evidence(file_bytes, filename, claim)
+        if error:
+            return VerifiedResult(
+                original_claim=claim,
+                status=VerificationStatus.NO_EVIDENCE,
+                confidence=0.0,
+                citations=[],
+                sources_used=[],
+                contradictory_evidence=[],
+                explanation=error,
+                total_sources_checked=0,
+                verification_method="pdf"
+            )
         
+        citations, contradicting = self._split_stance(claim, citations)
         if citations:
             confidence = round(sum(c.relevance_score for c in citations) / len(citations), 2)
             status = VerificationStatus.VERIFIED if confidence > 0.7 else VerificationStatus.PARTIALLY_VERIFIED
         else:
             confidence = 0.0
             status = VerificationStatus.NO_EVIDENCE
+        status, confidence = self._apply_contradiction(status, confidence, citations, contradicting)
         
-        explanation = self._explain(claim, status, confidence, citations, f"PDF: {filename}")
+        explanation = self._explain(claim, status, confidence, citations, f"PDF: {filename}", contradicting)
         
         return VerifiedResult(
             original_claim=claim,
@@ -421,15 +1787,16 @@ class VerificationEngine:
             confidence=confidence,
             citations=citations,
             sources_used=[source_info],
-            contradictory_evidence=[],
+            contradictory_evidence=contradicting,
             explanation=explanation,
             total_sources_checked=1,
             verification_method="pdf"
         )
     
+    @Tracer.traced("verify.url")
     def verify_url(self, url: str, claim: str) -> VerifiedResult:
-        page = URLProcessor.fetch(url)
-        if not page['success']:
+        source_info, citations, error = self._url_evidence(url, claim)
+        if error:
             return VerifiedResult(
                 original_claim=claim,
                 status=VerificationStatus.NO_EVIDENCE,
@@ -437,41 +1804,21 @@ class VerificationEngine:
                 citations=[],
                 sources_used=[],
                 contradictory_evidence=[],
-                explanation=f"URL Error: {page.get('error')}",
+                explanation=error,
                 total_sources_checked=0,
                 verification_method="url"
             )
         
-        found = URLProcessor.find_citations(page['content'], claim)
-        source_info = SourceInfo(
-            name=page['title'],
-            type="scraped_webpage",
-            url=url,
-            credibility_score=0.6,
-            date_accessed=datetime.now().isoformat()
-        )
-        
-        citations = []
-        for f in found:
-            citations.append(Citation(
-                quote=f['quote'],
-                context=f['context'],
-                source_title=page['title'],
-                source_publisher=url[:60] + "...",
-                source_type="scraped",
-                source_url=url,
-                relevance_score=f['relevance'],
-                access_date=datetime.now().isoformat()
-            ))
-        
+        citations, contradicting = self._split_stance(claim, citations)
         if citations:
             confidence = round(sum(c.relevance_score for c in citations) / len(citations), 2)
             status = VerificationStatus.VERIFIED if confidence > 0.7 else VerificationStatus.PARTIALLY_VERIFIED
         else:
             confidence = 0.0
             status = VerificationStatus.NO_EVIDENCE
+        status, confidence = self._apply_contradiction(status, confidence, citations, contradicting)
         
-        explanation = self._explain(claim, status, confidence, citations, f"Web: {page['title']}")
+        explanation = self._explain(claim, status, confidence, citations, f"Web: {source_info.name}", contradicting)
         
         return VerifiedResult(
             original_claim=claim,
@@ -479,40 +1826,16 @@ class VerificationEngine:
             confidence=confidence,
             citations=citations,
             sources_used=[source_info],
-            contradictory_evidence=[],
+            contradictory_evidence=contradicting,
             explanation=explanation,
             total_sources_checked=1,
             verification_method="url"
         )
     
+    @Tracer.traced("verify.text")
     def verify_text(self, text: str, source_name: str, claim: str) -> VerifiedResult:
-        found = TextProcessor.find_citations(text, source_name, claim)
-        source_info = SourceInfo(
-            name=source_name,
-            type="pasted_text",
-            url=None,
-            credibility_score=0.85,
-            date_accessed=datetime.now().isoformat()
-        )
-        
-        supporting = []
-        contradicting = []
-        
-        for f in found:
-            cit = Citation(
-                quote=f['quote'],
-                context=f['context'],
-                source_title=source_name,
-                source_publisher="User Provided Text",
-                source_type="pasted",
-                section=f"Paragraph {f.get('paragraph', 'Unknown')}",
-                relevance_score=f['relevance'],
-                access_date=datetime.now().isoformat()
-            )
-            if f.get('supports', True):
-                supporting.append(cit)
-            else:
-                contradicting.append(cit)
+        source_info, found, _ = self._text_evidence(text, source_name, claim)
+        supporting, contradicting = self._split_stance(claim, found)
         
         if supporting:
             confidence = round(sum(c.relevance_score for c in supporting) / len(supporting), 2)
@@ -525,11 +1848,12 @@ class VerificationEngine:
         else:
             confidence = 0.0
             status = VerificationStatus.NO_EVIDENCE
+        status, confidence = self._apply_contradiction(status, confidence, supporting, contradicting)
         
-        explanation = self._explain(claim, status, confidence, supporting, f"Text: {source_name}")
+        explanation = self._explain(claim, status, confidence, supporting, f"Text: {source_name}", contradicting)
         
         return VerifiedResult(
-#             original_claim=claim,
+            original_claim=claim,
             status=status,
             confidence=confidence,
             citations=supporting,
@@ -540,7 +1864,149 @@ class VerificationEngine:
             verification_method="pasted_text"
         )
     
-    def _explain(self, claim, status, confidence, citations, source_desc) -> str:
+    @Tracer.traced("verify.multi")
+    def verify_multi(self, claim: str, urls: List[str], files: List[tuple], texts: List[str]) -> MultiVerifiedResult:
+        tasks = []
+        for url in urls:
+            tasks.append(("url", url, lambda u=url: self._url_evidence(u, claim)))
+        for file_bytes, filename in files:
+            tasks.append(("pdf", filename, lambda b=file_bytes, n=filename: self._pdf_evidence(b, n, claim)))
+        for i, text in enumerate(texts, 1):
+            name = f"Text #{i}"
+            tasks.append(("text", name, lambda t=text, n=name: self._text_evidence(t, n, claim)))
+        
+        def run(task):
+            kind, label, fn = task
+            start = time.perf_counter()
+            try:
+                outcome = fn()
+            except Exception as e:
+                outcome = (None, [], f"{kind.upper()} Error: {e}")
+            return kind, label, outcome, (time.perf_counter() - start) * 1000
+        
+        from concurrent.futures import ThreadPoolExecutor
+        workers = max(1, min(MULTI_MAX_PARALLEL, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(Tracer.bind(run), tasks))
+        
+        all_citations = []
+        sources_info = []
+        timings = []
+        for kind, label, (source_info, found, error), elapsed in outcomes:
+            if source_info:
+                sources_info.append(source_info)
+            all_citations.extend(found)
+            timings.append(SourceTiming(
+                source=label,
+                kind=kind,
+                success=error is None,
+                elapsed_ms=round(elapsed, 1),
+                citations_found=len(found),
+                error=error
+            ))
+        
+        all_citations, contradicting = self._split_stance(claim, all_citations)
+        all_citations.sort(key=lambda c: c.relevance_score, reverse=True)
+        all_citations = all_citations[:MULTI_MAX_CITATIONS]
+        contradicting.sort(key=lambda c: c.relevance_score, reverse=True)
+        contradicting = contradicting[:MULTI_MAX_CITATIONS]
+        
+        if all_citations:
+            avg_rel = sum(c.relevance_score for c in all_citations) / len(all_citations)
+            avg_cred = sum(s.credibility_score for s in sources_info) / len(sources_info)
+            confidence = round((avg_rel * 0.6 + avg_cred * 0.4), 2)
+        else:
+            confidence = 0.0
+        
+        if confidence >= 0.8:
+            status = VerificationStatus.VERIFIED
+        elif confidence >= 0.6:
+            status = VerificationStatus.PARTIALLY_VERIFIED
+        elif confidence > 0:
+            status = VerificationStatus.UNVERIFIABLE
+        else:
+            status = VerificationStatus.NO_EVIDENCE
+        status, confidence = self._apply_contradiction(status, confidence, all_citations, contradicting)
+        
+        explanation = self._explain(claim, status, confidence, all_citations,
+                                    f"{len(sources_info)} of {len(tasks)} sources", contradicting)
+        
+        return MultiVerifiedResult(
+            original_claim=claim,
+            status=status,
+            confidence=confidence,
+            citations=all_citations,
+            sources_used=sources_info,
+            contradictory_evidence=contradicting,
+            explanation=explanation,
+            total_sources_checked=len(tasks),
+            verification_method="multi",
+            source_timings=timings
+        )
+    
+    @Tracer.traced("audit")
+    def audit_document(self, sentences: List[str], source_name: str, domain: str, max_claims: int,
+                       pages: Optional[List[int]] = None, progress=None) -> AuditReport:
+        detected = ClaimDetector.detect(sentences, max_claims)
+        unique = {}
+        for d in detected:
+            unique.setdefault(' '.join(d['sentence'].lower().split()), d['sentence'])
+        
+        total = len(unique)
+        results = {}
+        if progress:
+            progress(0, total)
+        
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max(1, min(AUDIT_MAX_PARALLEL, total))) as pool:
+            futures = {pool.submit(Tracer.bind(self.verify_apis), claim, domain): key for key, claim in unique.items()}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if progress:
+                    progress(done, total)
+        
+        reports = []
+        summary = {}
+        for d in detected:
+            result = results[' '.join(d['sentence'].lower().split())]
+            summary[result.status.value] = summary.get(result.status.value, 0) + 1
+            reports.append(ClaimReport(
+                claim=d['sentence'],
+                sentence_index=d['index'],
+                page=pages[d['index']] if pages else None,
+                checkworthiness=d['score'],
+                result=result
+            ))
+        
+        return AuditReport(
+            source_name=source_name,
+            sentences_scanned=len(sentences),
+            claims_detected=len(detected),
+            unique_lookups=total,
+            summary=summary,
+            claims=reports
+        )
+    
+    def _split_stance(self, claim: str, citations: List[Citation]):
+        if not citations:
+            return [], []
+        supporting = []
+        contradicting = []
+        for c, verdict in zip(citations, StanceClassifier.classify(claim, [c.quote for c in citations])):
+            if verdict['stance'] == 'contradict':
+                contradicting.append(c)
+            else:
+                supporting.append(c)
+        return supporting, contradicting
+    
+    def _apply_contradiction(self, status, confidence, supporting, contradicting):
+        against = sum(c.relevance_score for c in contradicting)
+        if contradicting and against > sum(c.relevance_score for c in supporting):
+            return VerificationStatus.CONTRADICTED, round(against / len(contradicting), 2)
+        return status, confidence
+    
+    @Tracer.traced("explain")
+    def _explain(self, claim, status, confidence, citations, source_desc, contradicting=None) -> str:
         lines = [
             "CITEGUARD VERIFICATION REPORT",
             "=" * 60,
@@ -567,11 +2033,20 @@ class VerificationEngine:
                 lines.append(f"   Relevance: {c.relevance_score:.0%}")
                 lines.append("")
         
+        if contradicting:
+            lines.append(f"CONTRADICTING EVIDENCE: {len(contradicting)}")
+            for i, c in enumerate(contradicting[:3], 1):
+                lines.append(f"{i}. \"{c.quote[:100]}...\"")
+                lines.append(f"   Source: {c.source_publisher}")
+            lines.append("")
+        
         lines.append("RECOMMENDATION:")
         if status == VerificationStatus.VERIFIED:
             lines.append("✓ ACCEPT - Strong evidence from sources")
         elif status == VerificationStatus.PARTIALLY_VERIFIED:
             lines.append("⚠ CAUTION - Partial support found")
+        elif status == VerificationStatus.CONTRADICTED:
+            lines.append("✗ REJECT - Sources contradict the claim")
         elif status == VerificationStatus.NO_EVIDENCE:
             lines.append("✗ NO EVIDENCE - No relevant citations")
         else:
@@ -579,370 +2054,525 @@ class VerificationEngine:
         
         return "\n".join(lines)
 
-engine = VerificationEngine()
-
-HTML_PAGE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>CiteGuard - Evidence-First Verification</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container { max-width: 900px; margin: 0 auto; }
-        .header { text-align: center; color: white; margin-bottom: 30px; }
-        .header h1 { font-size: 3em; margin-bottom: 10px; }
-        .header p { font-size: 1.2em; opacity: 0.9; }
-        .card {
-            background: white;
-            border-radius: 15px;
-            padding: 30px;
-            margin-bottom: 20px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-        }
-        .card h2 {
-            color: #333;
-            margin-bottom: 20px;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 10px;
-        }
-        .input-group { margin-bottom: 20px; }
-        label {
-            display: block;
-            margin-bottom: 8px;
-            color: #555;
-            font-weight: 600;
-        }
-        input[type="text"], textarea, select {
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            font-size: 16px;
-        }
-        input[type="text"]:focus, textarea:focus, select:focus {
-            outline: none;
-            border-color: #667eea;
-        }
-        textarea { min-height: 120px; resize: vertical; }
-        .btn {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 15px 40px;
-            font-size: 18px;
-            border-radius: 30px;
-            cursor: pointer;
-        }
-        .btn:hover { transform: translateY(-2px); box-shadow: 0 5px 20px rgba(102, 126, 234, 0.4); }
-        .result {
-            background: #f8f9fa;
-            border-radius: 10px;
-            padding: 20px;
-            margin-top: 20px;
-            display: none;
-        }
-        .result.show { display: block; }
-        .status-badge {
-            display: inline-block;
-            padding: 8px 20px;
-            border-radius: 20px;
-            font-weight: bold;
-            margin-bottom: 15px;
-        }
-        .verified { background: #d4edda; color: #155724; }
-        .partial { background: #fff3cd; color: #856404; }
-        .contradicted { background: #f8d7da; color: #721c24; }
-        .citation {
-            background: white;
-            border-left: 4px solid #667eea;
-            padding: 15px;
-            margin: 15px 0;
-            border-radius: 5px;
-        }
-        .citation-quote { font-style: italic; color: #333; margin-bottom: 10px; }
-        .citation-source { color: #667eea; font-weight: 600; font-size: 14px; }
-        .confidence-bar {
-            height: 30px;
-            background: #e9ecef;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 15px 0;
-        }
-        .confidence-fill {
-            height: 100%;
-            background: linear-gradient(90deg, #667eea, #764ba2);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }
-        .tabs { display: flex; gap: 10px; margin-bottom: 20px; }
-        .tab {
-            padding: 10px 20px;
-            background: #e9ecef;
-            border: none;
-            border-radius: 20px;
-            cursor: pointer;
-        }
-        .tab.active { background: #667eea; color: white; }
-        .tab-content { display: none; }
-        .tab-content.active { display: block; }
-        .loading { text-align: center; padding: 20px; display: none; }
-        .spinner {
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #667eea;
-            border-radius: 50%;
-            width: 40px;
-            height: 40px;
-            animation: spin 1s linear infinite;
-            margin: 0 auto 10px;
-        }
-        @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔍 CiteGuard</h1>
-            <p>Evidence-First Citation Verification</p>
-        </div>
-        
-        <div class="card">
-            <h2>Verify a Claim</h2>
-            
-            <div class="tabs">
-                <button class="tab active" onclick="showTab('api')">🔬 Real APIs</button>
-                <button class="tab" onclick="showTab('text')">📝 Paste Text</button>
-                <button class="tab" onclick="showTab('url')">🌐 Web URL</button>
-            </div>
-            
-            <div id="api" class="tab-content active">
-                <div class="input-group">
-                    <label>Enter your claim:</label>
-                    <input type="text" id="apiClaim" placeholder="e.g., Climate change is caused by humans">
-                </div>
-                <div class="input-group">
-                    <label>Domain:</label>
-                    <select id="domain">
-                        <option value="general">General</option>
-                        <option value="academic">Academic</option>
-                        <option value="medical">Medical</option>
-                    </select>
-                </div>
-                <button class="btn" onclick="verifyAPI()">Verify with Real Sources</button>
-            </div>
-            
-            <div id="text" class="tab-content">
-                <div class="input-group">
-                    <label>Paste your source text:</label>
-                    <textarea id="pastedText" placeholder="Paste article, paper, or document text here..."></textarea>
-                </div>
-                <div class="input-group">
-                    <label>What claim to verify?</label>
-                    <input type="text" id="textClaim" placeholder="e.g., Vaccines are safe">
-                </div>
-                <div class="input-group">
-                    <label>Source name (optional):</label>
-                    <input type="text" id="sourceName" placeholder="e.g., My Research Notes">
-                </div>
-                <button class="btn" onclick="verifyText()">Find Citations in Text</button>
-            </div>
-            
-            <div id="url" class="tab-content">
-                <div class="input-group">
-                    <label>Enter URL:</label>
-                    <input type="text" id="urlInput" placeholder="https://example.com/article">
-                </div>
-                <div class="input-group">
-                    <label>Claim to verify:</label>
-                    <input type="text" id="urlClaim" placeholder="e.g., New policy announced">
-                </div>
-                <button class="btn" onclick="verifyURL()">Scrape & Verify</button>
-            </div>
-            
-            <div class="loading" id="loading">
-                <div class="spinner"></div>
-                <p>Verifying against trusted sources...</p>
-            </div>
-            
-            <div class="result" id="result"></div>
-        </div>
-        
-        <div class="card">
-            <h2>📚 Trusted Sources</h2>
-            <ul style="margin-left: 20px; line-height: 2;">
-                <li><strong>PubMed</strong> - Peer-reviewed medical research</li>
-                <li><strong>Semantic Scholar</strong> - Academic papers</li>
-                <li><strong>Wikipedia</strong> - General knowledge</li>
-                <li><strong>Your uploads</strong> - PDFs, URLs, pasted text</li>
-            </ul>
-        </div>
-    </div>
-    
-    <script>
-        function showTab(tabName) {
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(t => t.classList.remove('active'));
-            event.target.classList.add('active');
-            document.getElementById(tabName).classList.add('active');
-            document.getElementById('result').classList.remove('show');
-        }
+class JobQueue:
+    def __init__(self, path: str):
+        self.path = path
+        self._handlers = {}
+        self._ready = False
+        self._init_lock = threading.Lock()
+    
+    def _connect(self):
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=30)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS jobs ("
+                        "id TEXT PRIMARY KEY, kind TEXT NOT NULL, state TEXT NOT NULL, payload TEXT NOT NULL, "
+                        "completed INTEGER NOT NULL DEFAULT 0, total INTEGER NOT NULL DEFAULT 0, "
+                        "created_at TEXT NOT NULL, heartbeat REAL NOT NULL, error TEXT, result TEXT)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, created_at)")
+                    conn.commit()
+                    conn.close()
+                    self._ready = True
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    def warm(self):
+        self._connect().close()
+    
+    def register(self, kind: str, handler):
+        self._handlers[kind] = handler
+    
+    def submit(self, kind: str, payload: Dict) -> JobStatus:
+        job_id = hashlib.sha256(os.urandom(16)).hexdigest()[:16]
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, state, payload, created_at, heartbeat) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, JobState.QUEUED.value, json.dumps(payload), datetime.now().isoformat(), time.time())
+            )
+        conn.close()
+        return self.get(job_id)
+    
+    def get(self, job_id: str) -> Optional[JobStatus]:
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        conn.close()
+        if not row:
+            return None
+        return JobStatus(
+            job_id=row['id'],
+            kind=row['kind'],
+            state=row['state'],
+            completed=row['completed'],
+            total=row['total'],
+            progress=1.0 if row['state'] == JobState.DONE.value else
+                     round(row['completed'] / row['total'], 2) if row['total'] else 0.0,
+            created_at=row['created_at'],
+            error=row['error'],
+            result=json.loads(row['result']) if row['result'] else None
+        )
+    
+    def _claim(self):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE jobs SET state = ? WHERE state = ? AND heartbeat < ?",
+                (JobState.QUEUED.value, JobState.RUNNING.value, time.time() - JOB_STALE_SECONDS)
+            )
+            row = conn.execute(
+                "SELECT id, kind, payload FROM jobs WHERE state = ? ORDER BY created_at LIMIT 1",
+                (JobState.QUEUED.value,)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE jobs SET state = ?, heartbeat = ? WHERE id = ?",
+                             (JobState.RUNNING.value, time.time(), row['id']))
+            conn.commit()
+            return row
+        finally:
+            conn.close()
+    
+    def _update(self, job_id: str, **fields):
+        fields['heartbeat'] = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                f"UPDATE jobs SET {', '.join(f'{k} = ?' for k in fields)} WHERE id = ?",
+                (*fields.values(), job_id)
+            )
+        conn.close()
+    
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM jobs WHERE state IN (?, ?) AND heartbeat < ?",
+                         (JobState.DONE.value, JobState.FAILED.value, cutoff))
+        conn.close()
+    
+    def run_next(self) -> bool:
+        row = self._claim()
+        if not row:
+            return False
+        job_id = row['id']
         
-        function showLoading() {
-            document.getElementById('loading').style.display = 'block';
-            document.getElementById('result').classList.remove('show');
-        }
+        def progress(completed, total):
+            self._update(job_id, completed=completed, total=total)
         
-        function hideLoading() {
-            document.getElementById('loading').style.display = 'none';
-        }
+        try:
+            handler = self._handlers[row['kind']]
+            result = handler(json.loads(row['payload']), progress)
+            self._update(job_id, state=JobState.DONE.value, result=json.dumps(result.model_dump(mode='json')))
+        except Exception as e:
+            print(f"Job {job_id} error: {e}")
+            self._update(job_id, state=JobState.FAILED.value, error=str(e))
+        return True
+    
+    def work(self, stop: threading.Event):
+        last_prune = 0.0
+        while not stop.is_set():
+            try:
+                if self.run_next():
+                    continue
+                if time.time() - last_prune > 3600:
+                    self._prune()
+                    last_prune = time.time()
+            except sqlite3.Error as e:
+                print(f"Job queue error: {e}")
+            stop.wait(JOB_POLL_SECONDS)
+    
+    def start_workers(self, count: int, stop: threading.Event) -> List[threading.Thread]:
+        threads = []
+        for i in range(count):
+            t = threading.Thread(target=self.work, args=(stop,), name=f"citeguard-job-{i}", daemon=True)
+            t.start()
+            threads.append(t)
+        return threads
+
+class ClaimStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._ready = False
+        self._init_lock = threading.Lock()
+    
+    def _connect(self):
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                    conn = sqlite3.connect(self.path, timeout=30)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS claims ("
+                        "id TEXT PRIMARY KEY, claim TEXT NOT NULL, domain TEXT NOT NULL, url TEXT, "
+                        "result TEXT NOT NULL, verified_at REAL NOT NULL, refreshed_at REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS evidence ("
+                        "claim_id TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL, "
+                        "content_hash TEXT NOT NULL, expires_at REAL NOT NULL, "
+                        "PRIMARY KEY (claim_id, kind, key))"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS evidence_expiry ON evidence (expires_at)")
+                    conn.commit()
+                    conn.close()
+                    self._ready = True
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    @staticmethod
+    def claim_id(claim: str, domain: str, url: Optional[str]) -> str:
+        return ContentCache.key(' '.join(claim.lower().split()), domain, url or '')[:16]
+    
+    @staticmethod
+    def content_hash(value) -> str:
+        return ContentCache.key(json.dumps(value, sort_keys=True))
+    
+    def warm(self):
+        self._connect().close()
+    
+    def dependencies(self, claim: str, domain: str, url: Optional[str]) -> List[Dict]:
+        retry_at = time.time() + CLAIM_RETRY_SECONDS
+        if url:
+            cached = content_cache.get("url", ContentCache.key(url))
+            return [{
+                'kind': 'url',
+                'key': url,
+                'content_hash': self.content_hash(cached['content'] if cached else None),
+                'expires_at': cached['checked_at'] + URL_FRESH_SECONDS if cached else retry_at
+            }]
+        deps = []
+        for provider, start, limit in RealAPIs.pages(VerificationEngine.windows(claim, domain)):
+            cached = RealAPIs.cached_page(provider, claim, start, limit)
+            deps.append({
+                'kind': 'provider',
+                'key': f"{provider}:{start}:{limit}",
+                'content_hash': self.content_hash(cached['results'] if cached else []),
+                'expires_at': cached['fetched_at'] + API_CACHE_SECONDS if cached else retry_at
+            })
+        return deps
+    
+    def save(self, claim: str, domain: str, url: Optional[str], result: VerifiedResult,
+             deps: List[Dict], verified_at: Optional[float] = None) -> StoredClaim:
+        claim_id = self.claim_id(claim, domain, url)
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO claims (id, claim, domain, url, result, verified_at, refreshed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (claim_id, claim, domain, url, result.model_dump_json(), verified_at or now, now)
+            )
+            conn.execute("DELETE FROM evidence WHERE claim_id = ?", (claim_id,))
+            conn.executemany(
+                "INSERT INTO evidence (claim_id, kind, key, content_hash, expires_at) VALUES (?, ?, ?, ?, ?)",
+                [(claim_id, d['kind'], d['key'], d['content_hash'], d['expires_at']) for d in deps]
+            )
+        conn.close()
+        return self.get(claim_id)
+    
+    def get(self, claim_id: str) -> Optional[StoredClaim]:
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM claims WHERE id = ?", (claim_id,)).fetchone()
+        conn.close()
+        if not row:
+            return None
+        return StoredClaim(
+            claim_id=row['id'],
+            claim=row['claim'],
+            domain=row['domain'],
+            url=row['url'],
+            verified_at=datetime.fromtimestamp(row['verified_at']).isoformat(),
+            refreshed_at=datetime.fromtimestamp(row['refreshed_at']).isoformat(),
+            result=VerifiedResult.model_validate_json(row['result'])
+        )
+    
+    def _due(self, now: float) -> List[str]:
+        conn = self._connect()
+        rows = conn.execute("SELECT DISTINCT claim_id FROM evidence WHERE expires_at <= ?", (now,)).fetchall()
+        conn.close()
+        return [r['claim_id'] for r in rows]
+    
+    def _current(self, claim: str, dep: Dict, report: Dict) -> Optional[Dict]:
+        now = time.time()
+        if dep['kind'] == 'url':
+            cached = content_cache.get("url", ContentCache.key(dep['key']))
+            if not cached or now - cached['checked_at'] >= URL_FRESH_SECONDS:
+                report['providers_requeried'] += 1
+                page = URLProcessor.fetch(dep['key'])
+                if not page['success']:
+                    return None
+                cached = content_cache.get("url", ContentCache.key(dep['key'])) or {'content': page['content'], 'checked_at': now}
+            return dict(dep, content_hash=self.content_hash(cached['content']),
+                        expires_at=cached['checked_at'] + URL_FRESH_SECONDS)
         
-        function displayResult(data) {
-            hideLoading();
-            const resultDiv = document.getElementById('result');
-            
-            let statusClass = 'unverifiable';
-            let statusText = data.status;
-            if (data.status === 'verified') { statusClass = 'verified'; statusText = '✅ VERIFIED'; }
-            else if (data.status === 'partially_verified') { statusClass = 'partial'; statusText = '⚠️ PARTIALLY VERIFIED'; }
-            else if (data.status === 'contradicted') { statusClass = 'contradicted'; statusText = '❌ CONTRADICTED'; }
-            
-            let citationsHtml = '';
-            if (data.citations && data.citations.length > 0) {
-                citationsHtml = '<h3>📖 Citations Found:</h3>';
-                data.citations.slice(0, 3).forEach((cit, i) => {
-                    citationsHtml += `
-                        <div class="citation">
-                            <div class="citation-quote">"${cit.quote}"</div>
-                            <div class="citation-source">
-                                Source: ${cit.source_publisher} 
-                                ${cit.source_url ? `<a href="${cit.source_url}" target="_blank">[View]</a>` : ''}
-                                ${cit.page ? `| Page ${cit.page}` : ''}
-                                | Relevance: ${Math.round(cit.relevance_score * 100)}%
-                            </div>
-                        </div>
-                    `;
-                });
-            }
-            
-            let sourcesHtml = '';
-            if (data.sources_used && data.sources_used.length > 0) {
-                sourcesHtml = '<h3>🔗 Sources Checked:</h3><ul>';
-                data.sources_used.forEach(src => {
-                    sourcesHtml += `<li>${src.name} ${src.url ? `<a href="${src.url}" target="_blank">[Link]</a>` : ''} (Credibility: ${Math.round(src.credibility_score * 100)}%)</li>`;
-                });
-                sourcesHtml += '</ul>';
-            }
-            
-            resultDiv.innerHTML = `
-                <div class="status-badge ${statusClass}">${statusText}</div>
-                <div class="confidence-bar">
-                    <div class="confidence-fill" style="width: ${data.confidence * 100}%">
-                        Confidence: ${Math.round(data.confidence * 100)}%
-                    </div>
-                </div>
-                ${citationsHtml}
-                ${sourcesHtml}
-                <h3>📝 Explanation:</h3>
-                <pre style="white-space: pre-wrap; background: white; padding: 15px; border-radius: 5px;">${data.explanation}</pre>
-            `;
-            resultDiv.classList.add('show');
-        }
+        provider, start, limit = dep['key'].split(':')
+        cached = RealAPIs.cached_page(provider, claim, int(start), int(limit))
+        if cached:
+            results, fetched_at = cached['results'], cached['fetched_at']
+        else:
+            report['providers_requeried'] += 1
+            results, fetched_at = RealAPIs.lookup(provider, claim, int(start), int(limit)), now
+            if not results:
+                return None
+        return dict(dep, content_hash=self.content_hash(results), expires_at=fetched_at + API_CACHE_SECONDS)
+    
+    def _refresh_one(self, claim_id: str, report: Dict):
+        stored = self.get(claim_id)
+        if not stored:
+            return
+        conn = self._connect()
+        deps = [dict(r) for r in conn.execute(
+            "SELECT kind, key, content_hash, expires_at FROM evidence WHERE claim_id = ?", (claim_id,))]
+        conn.close()
         
-        async function verifyAPI() {
-            const claim = document.getElementById('apiClaim').value;
-            const domain = document.getElementById('domain').value;
-            if (!claim) { alert('Enter a claim'); return; }
-            
-            showLoading();
-            try {
-                const response = await fetch('/verify', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({claim: claim, domain: domain})
-                });
-                const data = await response.json();
-                displayResult(data);
-            } catch (error) {
-                hideLoading();
-                alert('Error: ' + error.message);
-            }
-        }
+        current = []
+        for dep in deps:
+            report['dependencies_checked'] += 1
+            fresh = self._current(stored.claim, dep, report)
+            if fresh is None:
+                report['errors'] += 1
+                fresh = dict(dep, expires_at=time.time() + CLAIM_RETRY_SECONDS)
+            current.append(fresh)
         
-        async function verifyText() {
-            const text = document.getElementById('pastedText').value;
-            const claim = document.getElementById('textClaim').value;
-            const sourceName = document.getElementById('sourceName').value || 'Pasted Text';
-            
-            if (!text || !claim) { alert('Fill in both fields'); return; }
-            
-            showLoading();
-            try {
-                const response = await fetch('/verify/text', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({text: text, claim: claim, source_name: sourceName})
-                });
-                const data = await response.json();
-                displayResult(data);
-            } catch (error) {
-                hideLoading();
-                alert('Error: ' + error.message);
-            }
-        }
+        if [d['content_hash'] for d in current] == [d['content_hash'] for d in deps]:
+            report['unchanged'] += 1
+            conn = self._connect()
+            with conn:
+                conn.executemany("UPDATE evidence SET expires_at = ? WHERE claim_id = ? AND kind = ? AND key = ?",
+                                 [(d['expires_at'], claim_id, d['kind'], d['key']) for d in current])
+                conn.execute("UPDATE claims SET refreshed_at = ? WHERE id = ?", (time.time(), claim_id))
+            conn.close()
+            return
         
-        async function verifyURL() {
-            const url = document.getElementById('urlInput').value;
-            const claim = document.getElementById('urlClaim').value;
-            
-            if (!url || !claim) { alert('Fill in both fields'); return; }
-            
-            showLoading();
-            try {
-                const response = await fetch('/verify/url', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({url: url, claim: claim})
-                });
-                const data = await response.json();
-                displayResult(data);
-            } catch (error) {
-                hideLoading();
-                alert('Error: ' + error.message);
-            }
+        engine = get_engine()
+        if stored.url:
+            result = engine.verify_url(stored.url, stored.claim)
+        else:
+            result = engine.verify_apis(stored.claim, stored.domain)
+        report['recomputed'] += 1
+        if result.status != stored.result.status:
+            report['status_changes'].append({
+                'claim_id': claim_id,
+                'previous': stored.result.status.value,
+                'current': result.status.value
+            })
+        self.save(stored.claim, stored.domain, stored.url, result,
+                  self.dependencies(stored.claim, stored.domain, stored.url))
+    
+    def refresh(self, progress=None) -> RefreshReport:
+        due = self._due(time.time())
+        report = {
+            'claims_due': len(due),
+            'dependencies_checked': 0,
+            'providers_requeried': 0,
+            'unchanged': 0,
+            'recomputed': 0,
+            'errors': 0,
+            'status_changes': []
         }
-    </script>
-</body>
-</html>
-"""
+        lock = threading.Lock()
+        if progress:
+            progress(0, len(due))
+        
+        def run(claim_id):
+            local = dict.fromkeys(('dependencies_checked', 'providers_requeried', 'unchanged', 'recomputed', 'errors'), 0)
+            local['status_changes'] = []
+            self._refresh_one(claim_id, local)
+            with lock:
+                for key, value in local.items():
+                    report[key] += value
+        
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max(1, min(AUDIT_MAX_PARALLEL, len(due)))) as pool:
+            futures = [pool.submit(run, claim_id) for claim_id in due]
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Claim refresh error: {e}")
+                    report['errors'] += 1
+                if progress:
+                    progress(done, len(due))
+        return RefreshReport(**report)
+
+@lru_cache(maxsize=1)
+def get_engine() -> VerificationEngine:
+    return VerificationEngine()
+
+jobs = JobQueue(os.path.join(DATA_DIR, "jobs.db"))
+jobs.register("audit", lambda payload, progress: get_engine().audit_document(**payload, progress=progress))
+claims = ClaimStore(os.path.join(DATA_DIR, "claims.db"))
+jobs.register("refresh", lambda payload, progress: claims.refresh(progress=progress))
+
+@lru_cache(maxsize=1)
+def index_html() -> bytes:
+    with open(os.path.join(STATIC_DIR, "index.html"), 'rb') as f:
+        return f.read()
 
 @app.get("/", response_class=HTMLResponse)
-def web_interface():
-    return HTML_PAGE
+async def web_interface():
+    return HTMLResponse(index_html())
+
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return, e.g. status,confidence or citations.quote")
+
+def projection(fields: Optional[str], model) -> Optional[Dict]:
+    if not fields:
+        return None
+    include = {}
+    for path in (p.strip() for p in fields.split(',')):
+        if not path:
+            continue
+        top, _, sub = path.partition('.')
+        if top not in model.model_fields:
+            raise HTTPException(status_code=400, detail=f"Unknown field '{top}'. Available: {', '.join(model.model_fields)}")
+        if not sub:
+            include[top] = True
+            continue
+        args = typing.get_args(model.model_fields[top].annotation)
+        item = args[0] if args else None
+        if not (isinstance(item, type) and issubclass(item, BaseModel)) or sub not in item.model_fields:
+            raise HTTPException(status_code=400, detail=f"Unknown field '{path}'")
+        if include.get(top) is not True:
+            include.setdefault(top, {'__all__': set()})['__all__'].add(sub)
+    return include
+
+def project(result: BaseModel, include: Optional[Dict]):
+    if include is None:
+        return result
+    return JSONResponse(result.model_dump(mode='json', include=include))
 
 @app.post("/verify", response_model=VerifiedResult)
-def verify(req: VerifyRequest):
-    return engine.verify_apis(req.claim, req.domain)
+def verify(req: VerifyRequest, fields: Optional[str] = FIELDS_QUERY):
+    include = projection(fields, VerifiedResult)
+    try:
+        return project(get_engine().verify_apis(req.claim, req.domain, req.max_results, req.cursor), include)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/verify/pdf")
-async def verify_pdf(file: UploadFile = File(...), claim: str = Form(...)):
+@app.post("/verify/pdf", response_model=VerifiedResult)
+async def verify_pdf(file: UploadFile = File(...), claim: str = Form(...), fields: Optional[str] = FIELDS_QUERY):
+    include = projection(fields, VerifiedResult)
     content = await file.read()
-    return engine.verify_pdf(content, file.filename, claim)
+    return project(await run_in_threadpool(get_engine().verify_pdf, content, file.filename, claim), include)
 
 @app.post("/verify/url", response_model=VerifiedResult)
-def verify_url(req: URLRequest):
-    return engine.verify_url(req.url, req.claim)
+def verify_url(req: URLRequest, fields: Optional[str] = FIELDS_QUERY):
+    include = projection(fields, VerifiedResult)
+    return project(get_engine().verify_url(req.url, req.claim), include)
 
 @app.post("/verify/text", response_model=VerifiedResult)
-def verify_text(req: PasteRequest):
-    return engine.verify_text(req.text, req.source_name, req.claim)
+def verify_text(req: PasteRequest, fields: Optional[str] = FIELDS_QUERY):
+    include = projection(fields, VerifiedResult)
+    return project(get_engine().verify_text(req.text, req.source_name, req.claim), include)
+
+@app.post("/verify/multi", response_model=MultiVerifiedResult)
+async def verify_multi(
+    claim: str = Form(...),
+    urls: List[str] = Form([]),
+    texts: List[str] = Form([]),
+    files: List[UploadFile] = File([]),
+    fields: Optional[str] = FIELDS_QUERY
+):
+    include = projection(fields, MultiVerifiedResult)
+    if not (urls or texts or files):
+        raise HTTPException(status_code=400, detail="Provide at least one URL, file or text")
+    if len(urls) + len(texts) + len(files) > MULTI_MAX_SOURCES:
+        raise HTTPException(status_code=400, detail=f"At most {MULTI_MAX_SOURCES} sources per request")
+    uploads = [(await f.read(), f.filename) for f in files]
+    return project(await run_in_threadpool(get_engine().verify_multi, claim, urls, uploads, texts), include)
+
+@app.post("/audit/text", response_model=JobStatus, status_code=202)
+def audit_text(req: AuditRequest):
+    sentences = TextProcessor.split_sentences(req.text)
+    return jobs.submit("audit", {
+        'sentences': sentences,
+        'source_name': req.source_name,
+        'domain': req.domain,
+        'max_claims': req.max_claims
+    })
+
+@app.post("/audit/pdf", response_model=JobStatus, status_code=202)
+async def audit_pdf(
+    file: UploadFile = File(...),
+    domain: str = Form("general"),
+    max_claims: int = Form(50, ge=1, le=200)
+):
+    content = await file.read()
+    try:
+        page_texts = await run_in_threadpool(PDFProcessor.extract_pages, content)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"PDF Error: {e}")
+    if not page_texts:
+        raise HTTPException(status_code=400, detail="PDF Error: no extractable text")
+    sentences, pages = [], []
+    for number, page_text in enumerate(page_texts, 1):
+        for sentence in TextProcessor.split_sentences(page_text):
+            sentences.append(sentence)
+            pages.append(number)
+    return jobs.submit("audit", {
+        'sentences': sentences,
+        'source_name': file.filename,
+        'domain': domain,
+        'max_claims': max_claims,
+        'pages': pages
+    })
+
+@app.post("/claims", response_model=StoredClaim)
+def store_claim(req: StoreClaimRequest):
+    engine = get_engine()
+    if req.url:
+        result = engine.verify_url(req.url, req.claim)
+    else:
+        result = engine.verify_apis(req.claim, req.domain)
+    return claims.save(req.claim, req.domain, req.url, result, claims.dependencies(req.claim, req.domain, req.url))
+
+@app.get("/claims/{claim_id}", response_model=StoredClaim)
+def stored_claim(claim_id: str):
+    stored = claims.get(claim_id)
+    if not stored:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    return stored
+
+@app.post("/claims/refresh", response_model=JobStatus, status_code=202)
+def refresh_claims():
+    return jobs.submit("refresh", {})
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+def job_status(job_id: str):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    if not await run_in_threadpool(jobs.get, job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def stream():
+        last = None
+        while True:
+            job = await run_in_threadpool(jobs.get, job_id)
+            if not job:
+                return
+            snapshot = job.model_dump_json(exclude={'result'})
+            if snapshot != last:
+                last = snapshot
+                yield f"data: {snapshot}\n\n"
+            if job.state in (JobState.DONE, JobState.FAILED):
+                yield f"event: end\ndata: {job.model_dump_json()}\n\n"
+                return
+            await asyncio.sleep(JOB_POLL_SECONDS)
+    
+    return StreamingResponse(stream(), media_type="text/event-stream")
 
 @app.get("/sources")
 def sources():
@@ -952,15 +2582,46 @@ def sources():
             {"name": "Semantic Scholar", "url": "https://www.semanticscholar.org/"},
             {"name": "Wikipedia", "url": "https://en.wikipedia.org/"}
         ],
-        "user_sources": ["PDF Upload", "URL Scraping", "Pasted Text"]
+        "user_sources": ["PDF Upload", "URL Scraping", "Pasted Text", "Multi-Source"]
     }
 
 @app.get("/health")
-def health():
-    return {"status": "healthy", "pdf": PDF_SUPPORT}
+async def health():
+    return {"status": "healthy", "pdf": PDFProcessor.loaded()}
+
+@app.get("/ready")
+async def ready():
+    return JSONResponse(readiness, status_code=200 if readiness['ready'] else 503)
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["worker"]:
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else JOB_WORKERS
+        print(f"🛠 CiteGuard job worker x{count} on {jobs.path}")
+        stop = threading.Event()
+        try:
+            for t in jobs.start_workers(count, stop):
+                t.join()
+        except KeyboardInterrupt:
+            stop.set()
+        sys.exit(0)
+
     import uvicorn
+    if sys.argv[1:2] == ["serve"]:
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else int(os.environ.get("CITEGUARD_WORKERS", os.cpu_count() or 1))
+        host = os.environ.get("CITEGUARD_HOST", "0.0.0.0")
+        port = int(os.environ.get("PORT", 9000))
+        print(f"🚀 CiteGuard v3.0 production server: {workers} workers on {host}:{port}")
+        uvicorn.run(
+            "main:app",
+            app_dir=os.path.dirname(os.path.abspath(__file__)),
+            host=host,
+            port=port,
+            workers=workers,
+            proxy_headers=False,
+            timeout_graceful_shutdown=DRAIN_SECONDS
+        )
+        sys.exit(0)
+
     print("🚀 CiteGuard v3.0 with Web Interface")
     print("📚 APIs: PubMed, Semantic Scholar, Wikipedia")
     print("🌐 Open: http://127.0.0.1:9000")
@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+import pytest
+
+_root = tempfile.mkdtemp(prefix="citeguard-tests-")
+os.environ.setdefault("CITEGUARD_CACHE_DIR", os.path.join(_root, "cache"))
+os.environ.setdefault("CITEGUARD_DATA_DIR", os.path.join(_root, "data"))
+
+import main
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = main.ContentCache(str(tmp_path / "cache"), main.CACHE_MAX_BYTES)
+    monkeypatch.setattr(main, "content_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    calls = []
+    state = {'total': 23, 'prefix': 'r'}
+
+    def search(query, offset, limit):
+        calls.append((offset, limit))
+        return [{'id': f"{state['prefix']}{i}", 'title': f"{query} {i}"}
+                for i in range(offset, min(offset + limit, state['total']))]
+
+    monkeypatch.setattr(main.RealAPIs, "pubmed", staticmethod(search))
+    return {'calls': calls, 'state': state}
@@ -0,0 +1,37 @@
+import ipaddress
+
+import pytest
+
+from main import AdmissionMiddleware
+
+
+@pytest.fixture
+def admission():
+    proxies = [ipaddress.ip_network("127.0.0.1"), ipaddress.ip_network("10.0.0.0/8")]
+    return AdmissionMiddleware(None, {}, 1, 1, 1.0, 1.0, 1, {"known-key"}, proxies)
+
+
+def scope(peer, forwarded=None, api_key=None):
+    headers = []
+    if forwarded:
+        headers.append((b'x-forwarded-for', forwarded.encode()))
+    if api_key:
+        headers.append((b'x-api-key', api_key.encode()))
+    return {'client': (peer, 1234), 'headers': headers}
+
+
+@pytest.mark.parametrize("peer, forwarded, client", [
+    ("10.1.2.3", "8.8.8.8", "ip:8.8.8.8"),
+    ("10.1.2.3", "1.1.1.1, 8.8.8.8", "ip:8.8.8.8"),
+    ("10.1.2.3", "10.0.0.9, 8.8.8.8", "ip:8.8.8.8"),
+    ("10.1.2.3", "8.8.8.8, 10.0.0.7", "ip:8.8.8.8"),
+    ("5.5.5.5", "1.1.1.1", "ip:5.5.5.5"),
+    ("10.1.2.3", None, "ip:10.1.2.3"),
+])
+def test_client_is_rightmost_untrusted_hop(admission, peer, forwarded, client):
+    assert admission._client(scope(peer, forwarded)) == client
+
+
+def test_only_listed_api_keys_get_their_own_bucket(admission):
+    assert admission._client(scope("5.5.5.5", api_key="rotated")) == "ip:5.5.5.5"
+    assert admission._client(scope("5.5.5.5", api_key="known-key")).startswith("key:")
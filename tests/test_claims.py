@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+import main
+
+
+CLAIM = "coffee improves memory in adults"
+DOMAIN = "news"
+
+
+@pytest.fixture
+def wikipedia(cache, monkeypatch):
+    state = {'snippet': "Coffee improves memory in adults", 'calls': 0}
+
+    def search(query, offset, limit):
+        state['calls'] += 1
+        if not state['snippet']:
+            return []
+        return [{'id': 'wiki_1', 'title': 'Coffee', 'snippet': state['snippet'], 'url': 'https://en.wikipedia.org/wiki/Coffee',
+                 'publisher': 'Wikipedia', 'type': 'encyclopedia', 'credibility': 0.7}][:limit]
+
+    monkeypatch.setattr(main.RealAPIs, "wikipedia", staticmethod(search))
+    monkeypatch.setattr(main.RealAPIs, "abstracts", staticmethod(lambda results: {}))
+    return state
+
+
+@pytest.fixture
+def store(tmp_path):
+    return main.ClaimStore(str(tmp_path / "claims.db"))
+
+
+def save(store):
+    result = main.get_engine().verify_apis(CLAIM, DOMAIN)
+    return store.save(CLAIM, DOMAIN, None, result, store.dependencies(CLAIM, DOMAIN, None))
+
+
+def expiries(store, claim_id):
+    conn = store._connect()
+    rows = conn.execute("SELECT expires_at FROM evidence WHERE claim_id = ?", (claim_id,)).fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+def expire(store, tmp_path, monkeypatch):
+    conn = store._connect()
+    with conn:
+        conn.execute("UPDATE evidence SET expires_at = 0")
+    conn.close()
+    monkeypatch.setattr(main, "content_cache", main.ContentCache(str(tmp_path / "fresh-cache"), main.CACHE_MAX_BYTES))
+
+
+def test_unchanged_evidence_only_extends_expiries(store, wikipedia, tmp_path, monkeypatch):
+    stored = save(store)
+    expire(store, tmp_path, monkeypatch)
+    wikipedia['calls'] = 0
+
+    report = store.refresh()
+
+    assert (report.claims_due, report.providers_requeried, report.unchanged, report.recomputed, report.errors) == (1, 1, 1, 0, 0)
+    assert wikipedia['calls'] == 1
+    assert all(at > time.time() + main.CLAIM_RETRY_SECONDS for at in expiries(store, stored.claim_id))
+    assert store.get(stored.claim_id).result == stored.result
+    assert store.refresh().claims_due == 0
+
+
+def test_changed_page_recomputes_once_and_records_status_change(store, wikipedia, tmp_path, monkeypatch):
+    stored = save(store)
+    assert stored.result.status != main.VerificationStatus.CONTRADICTED
+    expire(store, tmp_path, monkeypatch)
+    wikipedia['snippet'] = "Coffee does not improve memory in adults"
+    wikipedia['calls'] = 0
+
+    report = store.refresh()
+
+    assert (report.recomputed, report.unchanged, report.errors) == (1, 0, 0)
+    assert wikipedia['calls'] == 1
+    assert report.status_changes == [{
+        'claim_id': stored.claim_id,
+        'previous': stored.result.status.value,
+        'current': main.VerificationStatus.CONTRADICTED.value
+    }]
+    assert store.get(stored.claim_id).result.status == main.VerificationStatus.CONTRADICTED
+
+
+def test_failing_upstream_is_retried_not_marked_fresh(store, wikipedia, tmp_path, monkeypatch):
+    wikipedia['snippet'] = None
+    stored = save(store)
+    assert all(at <= time.time() + main.CLAIM_RETRY_SECONDS for at in expiries(store, stored.claim_id))
+
+    expire(store, tmp_path, monkeypatch)
+    report = store.refresh()
+
+    assert (report.errors, report.recomputed) == (1, 0)
+    assert all(time.time() < at <= time.time() + main.CLAIM_RETRY_SECONDS for at in expiries(store, stored.claim_id))
+    assert store.get(stored.claim_id).result == stored.result
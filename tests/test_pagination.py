@@ -0,0 +1,49 @@
+import pytest
+
+from main import RealAPIs, VerificationEngine
+
+
+def ids(found):
+    return [r['id'] for r in found['pubmed'][0]]
+
+
+def test_first_page_fetches_only_requested_results(cache, provider):
+    found = RealAPIs.search("q", {'pubmed': (0, 2)})
+    assert ids(found) == ['r0', 'r1']
+    assert found['pubmed'][1] == 2
+    assert provider['calls'] == [(0, 2)]
+
+
+def test_unaligned_cursor_follow_up_uses_full_page(cache, provider):
+    found = RealAPIs.search("q", {'pubmed': (2, 5)})
+    assert ids(found) == ['r2', 'r3', 'r4', 'r5', 'r6']
+    assert found['pubmed'][1] == 7
+    assert provider['calls'] == [(0, 10)]
+
+
+def test_short_last_page_ends_pagination(cache, provider):
+    found = RealAPIs.search("q", {'pubmed': (18, 10)})
+    assert ids(found) == ['r18', 'r19', 'r20', 'r21', 'r22']
+    assert found['pubmed'][1] is None
+    assert provider['calls'] == [(10, 10), (20, 10)]
+
+
+def test_small_request_served_from_cached_full_page(cache, provider):
+    RealAPIs.search("q", {'pubmed': (2, 5)})
+    provider['calls'].clear()
+    found = RealAPIs.search("q", {'pubmed': (0, 2)})
+    assert ids(found) == ['r0', 'r1']
+    assert provider['calls'] == []
+
+
+@pytest.mark.parametrize("offset", [-1, 10 ** 6])
+def test_cursor_offsets_out_of_range_are_rejected(offset):
+    engine = VerificationEngine()
+    cursor = engine._encode_cursor("q", {'pubmed': offset})
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        engine._decode_cursor(cursor, "q")
+
+
+def test_cursor_round_trip():
+    engine = VerificationEngine()
+    assert engine._decode_cursor(engine._encode_cursor("q", {'pubmed': 7}), "q") == {'pubmed': 7}
@@ -0,0 +1,16 @@
+import pytest
+
+from main import StanceClassifier
+
+
+@pytest.mark.parametrize("claim, sentence, stance", [
+    ("Vaccines do not cause autism", "The idea that vaccines cause autism is a myth that has been debunked", "support"),
+    ("Vaccines are safe", "Vaccines are safe, and claims otherwise are false", "support"),
+    ("Exercise reduces heart disease risk", "Not only does exercise reduce heart disease risk, it also improves mood", "support"),
+    ("Vaccines cause autism", "The idea that vaccines cause autism is a myth that has been debunked", "contradict"),
+    ("Vaccines cause autism", "Vaccines cause autism, a claim that is false", "contradict"),
+    ("Coffee improves memory", "Coffee does not improve memory", "contradict"),
+    ("Coffee improves memory", "Coffee improves memory in older adults", "support"),
+])
+def test_heuristic_polarity(claim, sentence, stance):
+    assert StanceClassifier._heuristic(claim, sentence)['stance'] == stance